@@ -0,0 +1,16 @@
+"""Abstract Factory pattern: payment + notification families. Run `python -m abstract` for the walkthrough."""
+
+from lazy_exports import lazy_exports
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    "Payment": "abstract",
+    "Notification": "abstract",
+    "CreditCardPayment": "abstract",
+    "PayPalPayment": "abstract",
+    "EmailNotification": "abstract",
+    "SMSNotification": "abstract",
+    "PaymentFactory": "abstract",
+    "CreditCardFactory": "abstract",
+    "PayPalFactory": "abstract",
+    "payment_factory": "abstract",
+})
@@ -0,0 +1,65 @@
+"""
+Walkthrough of the abstract factory example: python -m abstract
+"""
+
+from .abstract import PayPalFactory
+
+
+# lets first see with out abstract factory pattern
+
+
+class CreditCardPayment:
+
+    def process_payment(self):
+        return "Payment processed using Credit Card."
+
+
+class PayPalPayment:
+    def process_payment(self):
+        return "Payment processed using PayPal."
+
+
+class EmailNotification:
+    def send_notification(self):
+        return "Notification sent via Email."
+
+
+class SMSNotification:
+    def send_notification(self):
+        return "Notification sent via SMS."
+
+
+# client code:
+
+def processs_order(payment_type):
+    if payment_type == 'credit':
+        payment = CreditCardPayment()
+        notification = EmailNotification()
+    elif payment_type == "paypal":
+        payment = PayPalPayment()
+        notification = SMSNotification()
+    else:
+        raise ValueError(f"Unknown payment type: {payment_type}")
+
+    print(payment.process_payment())
+    print(notification.send_notification())
+
+
+processs_order('credit')
+
+"""
+if-else logic is repetitive and hard to maintain.
+Adding a new payment system means updating multiple places.
+
+"""
+# with abstract factory:
+
+def process_order(factory):
+
+    payment = factory.create_payment()
+    notification = factory.create_notification()
+    print(payment.process_payment())
+    print(notification.send_notification())
+
+
+process_order(PayPalFactory())
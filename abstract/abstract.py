@@ -27,54 +27,12 @@ PayPal → SMS Notification
 
 """
 
+from time import perf_counter
 
-# lets first see with out abstract factory pattern
+import design_patterns_plugins as plugins
+from instrumentation import metrics
 
 
-class CreditCardPayment:
-
-    def process_payment(self):
-        return "Payment processed using Credit Card."
-
-
-class PayPalPayment:
-    def process_payment(self):
-        return "Payment processed using PayPal."
-
-
-class EmailNotification:
-    def send_notification(self):
-        return "Notification sent via Email."
-
-
-class SMSNotification:
-    def send_notification(self):
-        return "Notification sent via SMS."
-
-
-# client code:
-
-def processs_order(payment_type):
-    if payment_type == 'credit':
-        payment = CreditCardPayment()
-        notification = EmailNotification()
-    elif payment_type == "paypal":
-        payment = PayPalPayment()
-        notification = SMSNotification()
-    else:
-        raise ValueError(f"Unknown payment type: {payment_type}")
-
-    print(payment.process_payment())
-    print(notification.send_notification())
-
-
-processs_order('credit')
-
-"""
-if-else logic is repetitive and hard to maintain.
-Adding a new payment system means updating multiple places.
-
-"""
 # with abstract factory:
 
 
@@ -121,32 +79,48 @@ class PaymentFactory:
     def create_notification(self):
         pass
 
+    def _create(self, product, method):
+        # product() for the create_* methods, timed as "abstract.<factory>.<method>" when metrics are on
+        if not metrics.enabled:
+            return product()
+        start = perf_counter()
+        try:
+            return product()
+        finally:
+            metrics.observe(f"abstract.{type(self).__name__}.{method}", start)
+
 
 class CreditCardFactory(PaymentFactory):
     def create_payment(self):
-        return CreditCardPayment()
+        return self._create(CreditCardPayment, "create_payment")
 
     def create_notification(self):
-        return EmailNotification()
+        return self._create(EmailNotification, "create_notification")
 
 
 class PayPalFactory(PaymentFactory):
     def create_payment(self):
-        return PayPalPayment()
+        return self._create(PayPalPayment, "create_payment")
 
     def create_notification(self):
-        return SMSNotification()
+        return self._create(SMSNotification, "create_notification")
 
 
-def process_order(factory):
-
-    payment = factory.create_payment()
-    notification = factory.create_notification()
-    print(payment.process_payment())
-    print(notification.send_notification())
+# picking the family by name; families added later come from plugins
+# (see design_patterns_plugins/discovery.py).
+# The first unknown name in a process loads the plugin index; without a valid cache that scans
+# every installed distribution and writes ~/.cache/design-patterns
 
+def payment_factory(payment_type):
+    if payment_type == 'credit':
+        return CreditCardFactory()
+    elif payment_type == "paypal":
+        return PayPalFactory()
 
-process_order(PayPalFactory())
+    factory = plugins.load("payment", payment_type)
+    if factory is None:
+        raise ValueError(f"Unknown payment type: {payment_type}")
+    return factory()
 
 
 """
@@ -0,0 +1,21 @@
+"""Adapter pattern: media players, plugs and XML -> JSON stock data. Run `python -m adpater` for the walkthrough."""
+
+from lazy_exports import lazy_exports
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    "MediaPlayer": "adapter",
+    "AdvancedMediaPlayer": "adapter",
+    "VLCMediaPlayer": "adapter",
+    "MediaAdapter": "adapter",
+    "UniversalMediaPlayer": "adapter",
+    "USPlug": "adapter",
+    "EuropeanSocket": "adapter",
+    "SockerAdapter": "adapter",
+    "AnalyticsLibrary": "adapter",
+    "StockDataProvider": "adapter",
+    "AnalyticsAdapter": "adapter",
+    "make_adapter": "generated",
+    "Field": "schema",
+    "RecordSchema": "schema",
+    "STOCK_SCHEMA": "schema",
+})
@@ -0,0 +1,70 @@
+"""
+Walkthrough of the adapter examples: python -m adpater
+"""
+
+from .adapter import (AdvancedMediaPlayer, AnalyticsAdapter, AnalyticsLibrary,
+                      EuropeanSocket, SockerAdapter, StockDataProvider,
+                      UniversalMediaPlayer, USPlug)
+from .adapter import MediaPlayer as AdapterMediaPlayer
+from .generated import make_adapter
+
+
+# with out adapter pattern
+
+
+class MediaPlayer:
+
+    def play(self, audio_type, file_name):
+
+        if audio_type == 'mp3':
+            print(f"Playing MP3 file: {file_name}")
+        else:
+            print(f"Cannot play {audio_type} files. Unsupported format.")
+
+
+player = MediaPlayer()
+player.play('mp3', 'song.mp3')
+
+player.play('mp4', 'movie.mp4')
+
+
+# Adding new formats (e.g., MP4, VLC) requires modifying the MediaPlayer class.
+
+# with adapter pattern
+
+player = UniversalMediaPlayer()
+
+
+player.play("mp3", "song.mp3")
+player.play("vlc", "video.vlc")
+player.play("mp4", "movie.mp4")
+
+
+# electic recharge plugs
+
+us_plug = USPlug()
+adapter = SockerAdapter(us_plug)
+adapter.plug_into_european_socket()
+
+
+# the same adapters, generated from a method mapping
+
+PlugAdapter = make_adapter(EuropeanSocket, USPlug, {
+    "plug_into_european_socket": "plug_into_us_socket",
+})
+PlugAdapter(us_plug).plug_into_european_socket()
+
+Mp4Adapter = make_adapter(AdapterMediaPlayer, AdvancedMediaPlayer, {
+    "play": lambda player, audio_type, file_name: player.play_mp4(file_name),
+})
+Mp4Adapter(AdvancedMediaPlayer()).play("mp4", "movie.mp4")
+
+
+# stock data: XML -> JSON
+
+stock_data_prov = StockDataProvider()
+analytics_library = AnalyticsLibrary()
+
+adapter = AnalyticsAdapter(stock_data_prov)
+json_data = adapter.get_data_in_json()
+analytics_library.process_json(json_data=json_data)
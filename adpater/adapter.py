@@ -8,36 +8,19 @@ You use a USB-C to 3.5mm adapter to connect them. The laptop and headphones don
 
 """
 
+from time import perf_counter
 
-# Real World example:
-
-
-# Media Players
-
-# with out adapter pattern
+from instrumentation import metrics
 
+from .schema import STOCK_SCHEMA
 
-import json
-import xml.etree.ElementTree as ET  # extraterrestial LOL!
 
+# Real World example:
 
-class MediaPlayer:
-
-    def play(self, audio_type, file_name):
-
-        if audio_type == 'mp3':
-            print(f"Playing MP3 file: {file_name}")
-        else:
-            print(f"Cannot play {audio_type} files. Unsupported format.")
-
-
-player = MediaPlayer()
-player.play('mp3', 'song.mp3')
-
-player.play('mp4', 'movie.mp4')
 
+# Media Players
 
-# Adding new formats (e.g., MP4, VLC) requires modifying the MediaPlayer class.
+# with out adapter pattern (see __main__.py) adding new formats (e.g., MP4, VLC) requires modifying the MediaPlayer class.
 
 # with adapter pattern
 
@@ -71,10 +54,15 @@ class MediaAdapter(MediaPlayer):
             # pass
 
     def play(self, audio_type, file_name):
-        if audio_type == 'mp4':
-            self.advanced_player.play_mp4(file_name)
-        elif audio_type == 'vlc':
-            self.advanced_player.play_vlc((file_name))
+        start = metrics.enabled and perf_counter()
+        try:
+            if audio_type == 'mp4':
+                self.advanced_player.play_mp4(file_name)
+            elif audio_type == 'vlc':
+                self.advanced_player.play_vlc((file_name))
+        finally:
+            if start:
+                metrics.observe("adapter.MediaAdapter.play", start)
 
 
 # client
@@ -91,14 +79,6 @@ class UniversalMediaPlayer(MediaPlayer):
             print(f"Cannot play {audio_type} files. Unsupported format.")
 
 
-player = UniversalMediaPlayer()
-
-
-player.play("mp3", "song.mp3")
-player.play("vlc", "video.vlc")
-player.play("mp4", "movie.mp4")
-
-
 #  lets take a look at another example okay
 
 #  electic recharge plugs
@@ -128,13 +108,6 @@ class SockerAdapter(EuropeanSocket):
         self.us_plug.plug_into_us_socket()
 
 
-# client
-
-us_plug = USPlug()
-adapter = SockerAdapter(us_plug)
-adapter.plug_into_european_socket()
-
-
 """
 Adaptee: The class with the incompatible interface (e.g., AdvancedMediaPlayer or USPlug).
 Target Interface: The expected interface (e.g., MediaPlayer or EuropeanSocket).
@@ -156,7 +129,6 @@ Adapter:
     This allows the Adaptee to be used seamlessly without the client needing to know about its mismatched interface.
 
 
-
 i.e The Adapter makes the Adaptee "fit" into the client's expectations, like a power plug adapter allows a foreign device to work with your local sockets.
 
 
@@ -199,29 +171,94 @@ class StockDataProvider:
 
 class AnalyticsAdapter:
 
-    def __init__(self, stock_data_provider):
+    def __init__(self, stock_data_provider, schema=None):
         self.stock_data_provider = stock_data_provider  # adaptee
+        # which fields to pull out of every record (see schema.py)
+        self.schema = STOCK_SCHEMA if schema is None else schema
 
-    def get_data_in_json(self):
+    def _records(self):
+        # imported here so that importing this module stays cheap
+        import xml.etree.ElementTree as ET  # extraterrestial LOL!
 
         xml_data = self.stock_data_provider.get_xml_data()
-
         root = ET.fromstring(xml_data)
+        return xml_data, root.findall(self.schema.tag)
 
-        stocks = []
-        for stock in root.findall('stock'):
-            stock_info = {
-                "name": stock.find('name').text,
-                "price": stock.find('price').text
-            }
-            stocks.append(stock_info)
-
-        return json.dumps(stocks)
+    # All three outputs report into metrics the same way: the time of the whole
+    # conversion and the size of the XML read, in UTF-8 bytes.
 
+    # batch: all records at once, as JSON
 
-stock_data_prov = StockDataProvider()
-analytics_library = AnalyticsLibrary()
-
-adapter = AnalyticsAdapter(stock_data_prov)
-json_data = adapter.get_data_in_json()
-analytics_library.process_json(json_data=json_data)
+    def get_data_in_json(self):
+        start = metrics.enabled and perf_counter()
+        xml_data = ""
+        try:
+            import json
+
+            xml_data, records = self._records()
+            record = self.schema.compile().record
+            stocks = [record(stock) for stock in records]
+
+            return json.dumps(stocks)
+        finally:
+            if start:
+                metrics.observe("adapter.AnalyticsAdapter.get_data_in_json", start,
+                                _encoded_size(xml_data))
+
+    # streaming: one dict per record, without keeping the whole tree around.
+    # Timed from the first record asked for until the iteration ends.
+
+    def iter_records(self):
+        import io
+        import xml.etree.ElementTree as ET
+
+        start = metrics.enabled and perf_counter()
+        xml_data = ""
+        try:
+            record = self.schema.compile().record
+            tag = self.schema.tag
+            xml_data = self.stock_data_provider.get_xml_data()
+
+            depth = 0
+            root = None
+            for event, element in ET.iterparse(io.StringIO(xml_data), events=("start", "end")):
+                if event == "start":
+                    depth += 1
+                    if root is None:
+                        root = element
+                    continue
+                depth -= 1
+                # records are the children of the root element, like findall(tag)
+                if depth == 1 and element.tag == tag:
+                    yield record(element)
+                    root.clear()
+        finally:
+            if start:
+                metrics.observe("adapter.AnalyticsAdapter.iter_records", start,
+                                _encoded_size(xml_data))
+
+    # columnar: field name -> list of values
+
+    def get_columns(self):
+        start = metrics.enabled and perf_counter()
+        xml_data = ""
+        try:
+            extractor = self.schema.compile()
+            values = extractor.values
+            xml_data, records = self._records()
+            rows = [values(stock) for stock in records]
+            if not rows:
+                return {name: [] for name in extractor.names}
+            return {name: list(column) for name, column in zip(extractor.names, zip(*rows))}
+        finally:
+            if start:
+                metrics.observe("adapter.AnalyticsAdapter.get_columns", start,
+                                _encoded_size(xml_data))
+
+
+def _encoded_size(xml_data):
+    # bytes of XML processed; an ASCII str (the usual case) is one byte per
+    # character, and isascii() is a flag check, so only other text is encoded
+    if isinstance(xml_data, (bytes, bytearray)) or xml_data.isascii():
+        return len(xml_data)
+    return len(xml_data.encode("utf-8"))
@@ -0,0 +1,93 @@
+"""
+Adapters generated from a method mapping instead of written by hand.
+
+SockerAdapter and MediaAdapter in adapter.py are written out by hand, and every call goes through their
+wrapper method (and the `if audio_type == ...` checks) before it reaches the adaptee.
+make_adapter() builds the adapter class from a declaration:
+
+    PlugAdapter = make_adapter(EuropeanSocket, USPlug, {
+        "plug_into_european_socket": "plug_into_us_socket",   # pure rename
+    })
+
+    Mp4Adapter = make_adapter(MediaPlayer, AdvancedMediaPlayer, {
+        # real translation: gets the adaptee first, then the target method's arguments
+        "play": lambda player, audio_type, file_name: player.play_mp4(file_name),
+    })
+
+    adapter = PlugAdapter(USPlug())
+    adapter.plug_into_european_socket()
+
+A rename is bound straight to the adaptee's bound method when the adapter is created, so calling it
+costs the same as calling the adaptee. A translation is bound to the adaptee as its first argument,
+so the translation itself is the only extra call.
+
+Classes are cached by (target, adaptee, mapping), so asking twice for the same adapter gives back
+the same class. A translation written inline, like the lambda above, is a new function object on
+every call; it is keyed by its code, defaults and closure values instead, so the same lambda
+evaluated again still hits the cache (and the cache cannot grow with every call).
+"""
+
+from types import FunctionType, MethodType
+
+
+_adapter_cache = {}
+
+
+def _spec_key(spec):
+    # what a mapping entry is cached by; None if it cannot be used as a key
+    if isinstance(spec, FunctionType):
+        try:
+            cells = tuple(cell.cell_contents for cell in spec.__closure__ or ())
+        except ValueError:  # a closure variable that is not assigned yet
+            return None
+        kwdefaults = tuple(sorted((spec.__kwdefaults__ or {}).items()))
+        key = (spec.__code__, spec.__defaults__, kwdefaults, cells)
+    else:
+        key = spec  # a method name, a bound method, a partial, ...
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def make_adapter(target, adaptee, mapping):
+    renames = []
+    translations = []
+    for method, spec in mapping.items():
+        if not callable(getattr(target, method, None)):
+            raise ValueError(f"{target.__name__} has no method {method!r}")
+        if isinstance(spec, str):
+            if not callable(getattr(adaptee, spec, None)):
+                raise ValueError(f"{adaptee.__name__} has no method {spec!r}")
+            renames.append((method, spec))
+        elif callable(spec):
+            translations.append((method, spec))
+        else:
+            raise ValueError(f"Mapping for {method!r} must be a method name or a callable")
+
+    spec_keys = tuple(sorted((method, _spec_key(spec)) for method, spec in mapping.items()))
+    key = None if any(k is None for _, k in spec_keys) else (target, adaptee, spec_keys)
+    cls = _adapter_cache.get(key) if key is not None else None
+    if cls is not None:
+        return cls
+
+    def __init__(self, adaptee_object):
+        self.adaptee = adaptee_object
+        # instance attributes win over the target's (non-data) methods,
+        # so these are what the client ends up calling
+        for method, name in renames:
+            setattr(self, method, getattr(adaptee_object, name))
+        for method, translate in translations:
+            setattr(self, method, MethodType(translate, adaptee_object))
+
+    name = f"{adaptee.__name__}To{target.__name__}Adapter"
+    cls = type(name, (target,), {
+        "__init__": __init__,
+        "__module__": __name__,
+        "__doc__": f"Adapts {adaptee.__name__} to {target.__name__}, generated by make_adapter().",
+    })
+
+    if key is not None:
+        _adapter_cache[key] = cls
+    return cls
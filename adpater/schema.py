@@ -0,0 +1,130 @@
+"""
+Declared record schemas for the XML -> JSON adapter.
+
+AnalyticsAdapter used to hard-code "name" and "price" and call stock.find(...) once per field, so a
+record with 50 fields was searched 50 times. A schema declares the fields instead:
+
+    STOCK_SCHEMA = RecordSchema("stock", [
+        Field("name"),
+        Field("price", convert=float, default=0.0),
+        Field("bid", path="quote/bid", convert=float),
+    ])
+
+schema.compile() turns it into an extractor that walks the children of a record once, looks every
+child tag up in a dict and converts the text right there. The extractor is built once per schema and
+shared by the batch, streaming and columnar paths of AnalyticsAdapter.
+
+A field that is missing (or has no text) gets its default. When a tag appears more than once,
+the first one wins, like find().
+
+A path is a list of child tags separated by "/", and a tag may carry a namespace in ElementTree's
+"{uri}name" form ("quote/{http://example.com/q}bid"). Anything else find() understands (".", "..",
+"*", "//", [predicates], prefixed names) is not supported: compile() raises ValueError for it rather
+than giving every record the default.
+"""
+
+
+class Field:
+
+    def __init__(self, name, path=None, convert=None, default=None):
+        # path is relative to the record element, e.g. "price" or "quote/bid"; defaults to name.
+        # convert is applied to the element text (None keeps the text as a string)
+        self.name = name
+        self.path = path or name
+        self.convert = convert
+        self.default = default
+
+
+class Extractor:
+
+    def __init__(self, fields):
+        self.names = [field.name for field in fields]
+        self.defaults = [field.default for field in fields]
+        self._walk = _compile_walk([(slot, _split_path(field.path), field.convert)
+                                    for slot, field in enumerate(fields)])
+
+    def values(self, element):
+        # field values of one record, in schema order
+        values = self.defaults[:]
+        self._walk(element, values)
+        return values
+
+    def record(self, element):
+        return dict(zip(self.names, self.values(element)))
+
+
+# one child tag, optionally with a namespace: "bid" or "{http://example.com/q}bid"
+_TAG = r"(?:\{[^{}]*\})?[^{}/\[\]@*():\s]+"
+
+
+def _split_path(path):
+    # "quote/{http://example.com/q}bid" -> ["quote", "{http://example.com/q}bid"]:
+    # slashes inside {...} belong to the namespace URI
+    import re
+
+    parts = re.findall(_TAG, path) if re.fullmatch(f"{_TAG}(?:/{_TAG})*", path) else []
+    if not parts or any(part in (".", "..") for part in parts):
+        raise ValueError(f"Unsupported field path {path!r}: use child tags separated by '/'")
+    return parts
+
+
+def _compile_walk(entries):
+    # entries: (slot, remaining path parts, convert). Fields that end at this level are looked up by
+    # tag; deeper paths are grouped by their first tag and get a walker of their own
+    direct = {}
+    deeper = {}
+    for slot, parts, convert in entries:
+        if len(parts) == 1:
+            direct.setdefault(parts[0], []).append((slot, convert))
+        else:
+            deeper.setdefault(parts[0], []).append((slot, parts[1:], convert))
+    nested = {tag: _compile_walk(group) for tag, group in deeper.items()}
+
+    # the common case, one field per tag and nothing nested, gets the tightest loop
+    if not nested and all(len(targets) == 1 for targets in direct.values()):
+        single = {tag: targets[0] for tag, targets in direct.items()}
+        lookup = single.get
+
+        def walk(element, values):
+            # walked backwards so that the first of repeated tags is written last and wins
+            for child in reversed(element):
+                target = lookup(child.tag)
+                if target is not None:
+                    text = child.text
+                    if text is not None:
+                        slot, convert = target
+                        values[slot] = text if convert is None else convert(text)
+        return walk
+
+    lookup = direct.get
+    nested_lookup = nested.get
+
+    def walk(element, values):
+        for child in reversed(element):
+            targets = lookup(child.tag)
+            if targets is not None:
+                text = child.text
+                if text is not None:
+                    for slot, convert in targets:
+                        values[slot] = text if convert is None else convert(text)
+            walker = nested_lookup(child.tag)
+            if walker is not None:
+                walker(child, values)
+    return walk
+
+
+class RecordSchema:
+
+    def __init__(self, tag, fields):
+        self.tag = tag
+        self.fields = list(fields)
+        self._extractor = None
+
+    def compile(self):
+        if self._extractor is None:
+            self._extractor = Extractor(self.fields)
+        return self._extractor
+
+
+# what AnalyticsAdapter has always produced: name and price, as strings
+STOCK_SCHEMA = RecordSchema("stock", [Field("name"), Field("price")])
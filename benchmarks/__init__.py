@@ -0,0 +1,8 @@
+"""
+Benchmarks for the pattern examples.
+
+    python -m benchmarks run -o results.json
+    python -m benchmarks compare old.json new.json --threshold 0.10
+
+See benchmarks/runner.py for how benchmarks are registered and timed.
+"""
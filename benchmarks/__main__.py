@@ -0,0 +1,56 @@
+"""
+python -m benchmarks run [-k NAME] [-o results.json] [--repeat N] [--warmup N] [--heavy]
+python -m benchmarks compare OLD.json NEW.json [--threshold 0.10]
+python -m benchmarks list
+"""
+
+import argparse
+import sys
+
+from . import (bench_adapter, bench_builder, bench_factory, bench_imports,  # noqa: F401
+               bench_instrumentation, bench_plugins, bench_singleton)
+from .runner import benchmarks, compare, load, run_all, save
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the benchmarks")
+    run.add_argument("-k", dest="pattern", help="only run benchmarks whose name contains this")
+    run.add_argument("-o", "--output", help="write the results as JSON to this file")
+    run.add_argument("--repeat", type=int, default=5)
+    run.add_argument("--warmup", type=int, default=1)
+    run.add_argument("--heavy", action="store_true",
+                     help="also run the heavy benchmarks (e.g. 10M stocks)")
+
+    cmp = commands.add_parser("compare", help="compare two result files")
+    cmp.add_argument("old")
+    cmp.add_argument("new")
+    cmp.add_argument("--threshold", type=float, default=0.10,
+                     help="slowdown of the median that counts as a regression (default 0.10)")
+
+    listing = commands.add_parser("list", help="list the benchmarks")
+    listing.add_argument("--heavy", action="store_true")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run_all(args.pattern, warmup=args.warmup, repeat=args.repeat, heavy=args.heavy)
+        if args.output:
+            save(results, args.output)
+        return 0
+
+    if args.command == "compare":
+        regressions = compare(load(args.old), load(args.new), threshold=args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+            return 1
+        return 0
+
+    for bench in benchmarks(heavy=args.heavy):
+        print(bench.name + (" (heavy)" if bench.heavy else ""))
+    return 0
+
+
+sys.exit(main())
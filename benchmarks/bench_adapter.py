@@ -0,0 +1,195 @@
+"""
+Adapter dispatch and XML -> JSON conversion.
+"""
+
+import contextlib
+import os
+
+from adpater import (AdvancedMediaPlayer, AnalyticsAdapter, EuropeanSocket, Field,
+                     MediaAdapter, MediaPlayer, RecordSchema, SockerAdapter, StockDataProvider,
+                     UniversalMediaPlayer, USPlug, make_adapter)
+
+from .runner import benchmark
+
+
+PLAYS = 1_000
+FORMATS = [("mp3", "song.mp3"), ("vlc", "video.vlc"), ("mp4", "movie.mp4")]
+
+
+@benchmark("adapter.media_player_play", number=10, ops=PLAYS * len(FORMATS))
+def media_player_play():
+    player = UniversalMediaPlayer()
+    devnull = open(os.devnull, "w")
+
+    def run():
+        # the players print, keep that out of the terminal
+        with contextlib.redirect_stdout(devnull):
+            for _ in range(PLAYS):
+                for audio_type, file_name in FORMATS:
+                    player.play(audio_type, file_name)
+    return run
+
+
+# per-call cost of hand-written vs generated adapters, next to calling the adaptee directly.
+# The adaptees, and SockerAdapter's own "Adapting..." line, are swapped for versions that do not
+# print, so only the adapter cost is left.
+
+class QuietUSPlug(USPlug):
+    def plug_into_us_socket(self):
+        pass
+
+
+class QuietMp4Player(AdvancedMediaPlayer):
+    def play_mp4(self, file_name):
+        pass
+
+
+class QuietSockerAdapter(SockerAdapter):
+    # the hand-written adapter without its print, same wrapper call otherwise
+    def plug_into_european_socket(self):
+        self.us_plug.plug_into_us_socket()
+
+
+def repeated(call):
+    def run():
+        for _ in range(PLAYS):
+            call()
+    return run
+
+
+@benchmark("adapter.socket.direct", number=100, ops=PLAYS)
+def socket_direct():
+    return repeated(QuietUSPlug().plug_into_us_socket)
+
+
+@benchmark("adapter.socket.handwritten", number=100, ops=PLAYS)
+def socket_handwritten():
+    return repeated(QuietSockerAdapter(QuietUSPlug()).plug_into_european_socket)
+
+
+@benchmark("adapter.socket.generated", number=100, ops=PLAYS)
+def socket_generated():
+    PlugAdapter = make_adapter(EuropeanSocket, USPlug, {
+        "plug_into_european_socket": "plug_into_us_socket",
+    })
+    return repeated(PlugAdapter(QuietUSPlug()).plug_into_european_socket)
+
+
+@benchmark("adapter.media.direct", number=100, ops=PLAYS)
+def media_direct():
+    player = QuietMp4Player()
+    return repeated(lambda: player.play_mp4("movie.mp4"))
+
+
+@benchmark("adapter.media.handwritten", number=100, ops=PLAYS)
+def media_handwritten():
+    adapter = MediaAdapter("mp4")
+    adapter.advanced_player = QuietMp4Player()
+    return repeated(lambda: adapter.play("mp4", "movie.mp4"))
+
+
+def _play_mp4(player, audio_type, file_name):
+    player.play_mp4(file_name)
+
+
+@benchmark("adapter.media.generated", number=100, ops=PLAYS)
+def media_generated():
+    Mp4Adapter = make_adapter(MediaPlayer, AdvancedMediaPlayer, {"play": _play_mp4})
+    adapter = Mp4Adapter(QuietMp4Player())
+    return repeated(lambda: adapter.play("mp4", "movie.mp4"))
+
+
+class GeneratedStockDataProvider(StockDataProvider):
+
+    def __init__(self, count):
+        self.xml_data = "<stocks>" + "".join(
+            f"<stock><name>S{i}</name><price>{i % 1000}.25</price></stock>"
+            for i in range(count)) + "</stocks>"
+
+    def get_xml_data(self):
+        return self.xml_data
+
+
+def analytics_adapter(count):
+    def setup():
+        return AnalyticsAdapter(GeneratedStockDataProvider(count)).get_data_in_json
+    return setup
+
+
+for count, label, number, heavy in ((1_000, "1K", 20, False),
+                                    (1_000_000, "1M", 1, False),
+                                    (10_000_000, "10M", 1, True)):
+    benchmark(f"adapter.analytics_json.{label}", number=number, ops=count,
+              heavy=heavy)(analytics_adapter(count))
+
+
+# wide records: 50 fields per stock, every one declared in the schema
+
+WIDE_FIELDS = 50
+WIDE_RECORDS = 10_000
+
+WIDE_SCHEMA = RecordSchema("stock", [Field("name")] + [
+    Field(f"f{i}", convert=float, default=0.0) for i in range(WIDE_FIELDS - 1)])
+
+
+class WideStockDataProvider(StockDataProvider):
+
+    def __init__(self, count=WIDE_RECORDS):
+        fields = "".join(f"<f{i}>{i}.5</f{i}>" for i in range(WIDE_FIELDS - 1))
+        self.xml_data = "<stocks>" + "".join(
+            f"<stock><name>S{n}</name>{fields}</stock>" for n in range(count)) + "</stocks>"
+
+    def get_xml_data(self):
+        return self.xml_data
+
+
+def _wide_records():
+    import xml.etree.ElementTree as ET
+
+    return ET.fromstring(WideStockDataProvider().get_xml_data()).findall("stock")
+
+
+@benchmark("adapter.wide.find_per_field", number=3, ops=WIDE_RECORDS)
+def wide_find_per_field():
+    # what get_data_in_json used to do: one find() per field per record
+    records = _wide_records()
+    fields = WIDE_SCHEMA.fields
+
+    def run():
+        for stock in records:
+            info = {}
+            for field in fields:
+                element = stock.find(field.path)
+                text = None if element is None else element.text
+                if text is None:
+                    info[field.name] = field.default
+                else:
+                    info[field.name] = text if field.convert is None else field.convert(text)
+    return run
+
+
+@benchmark("adapter.wide.compiled", number=3, ops=WIDE_RECORDS)
+def wide_compiled():
+    records = _wide_records()
+    record = WIDE_SCHEMA.compile().record
+
+    def run():
+        for stock in records:
+            record(stock)
+    return run
+
+
+@benchmark("adapter.wide.batch_json", number=3, ops=WIDE_RECORDS)
+def wide_batch_json():
+    return AnalyticsAdapter(WideStockDataProvider(), WIDE_SCHEMA).get_data_in_json
+
+
+@benchmark("adapter.wide.streaming", number=3, ops=WIDE_RECORDS)
+def wide_streaming():
+    adapter = AnalyticsAdapter(WideStockDataProvider(), WIDE_SCHEMA)
+    return lambda: sum(1 for _ in adapter.iter_records())
+
+
+@benchmark("adapter.wide.columnar", number=3, ops=WIDE_RECORDS)
+def wide_columnar():
+    return AnalyticsAdapter(WideStockDataProvider(), WIDE_SCHEMA).get_columns
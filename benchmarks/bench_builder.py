@@ -0,0 +1,76 @@
+"""
+House construction and binary House records.
+"""
+
+import io
+import pickle
+
+from builder import (Director, GlassHouseBuilder, WoodenHouseBuilder,
+                     compile_plan, dumps, iter_file, loads)
+
+from .runner import benchmark
+
+
+HOUSES = 10_000
+
+
+@benchmark("builder.construct_house_fresh", number=100_000)
+def construct_house_fresh():
+    # a new builder per house, the only way to get distinct houses step by step
+    return lambda: Director(WoodenHouseBuilder()).construct_house()
+
+
+@benchmark("builder.construct_many", number=10, ops=HOUSES)
+def construct_many():
+    director = Director(WoodenHouseBuilder())
+    return lambda: director.construct_many(HOUSES)
+
+
+@benchmark("builder.construct_compiled", number=100_000)
+def construct_compiled():
+    # compare with construct_house_fresh: both give a new house on every call.
+    # The first call installs the plan as the director's construct_compiled
+    director = Director(WoodenHouseBuilder())
+    director.construct_compiled()
+    return director.construct_compiled
+
+
+@benchmark("builder.compile_plan_function", number=100_000)
+def compile_plan_function():
+    # the bare function compile_plan() generates, without the Director around it
+    return compile_plan(WoodenHouseBuilder())
+
+
+def _houses():
+    return (Director(WoodenHouseBuilder()).construct_many(HOUSES // 2)
+            + Director(GlassHouseBuilder()).construct_many(HOUSES // 2))
+
+
+@benchmark("builder.house_io.dumps", number=10, ops=HOUSES)
+def house_io_dumps():
+    houses = _houses()
+    return lambda: dumps(houses)
+
+
+@benchmark("builder.house_io.loads", number=10, ops=HOUSES)
+def house_io_loads():
+    data = dumps(_houses())
+    return lambda: loads(data)
+
+
+@benchmark("builder.house_io.iter_file", number=10, ops=HOUSES)
+def house_io_iter_file():
+    f = io.BytesIO(dumps(_houses()))
+    return lambda: list(iter_file(f))
+
+
+@benchmark("builder.house_io.pickle_dumps", number=10, ops=HOUSES)
+def pickle_dumps():
+    houses = _houses()
+    return lambda: pickle.dumps(houses, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+@benchmark("builder.house_io.pickle_loads", number=10, ops=HOUSES)
+def pickle_loads():
+    data = pickle.dumps(_houses(), protocol=pickle.HIGHEST_PROTOCOL)
+    return lambda: pickle.loads(data)
@@ -0,0 +1,39 @@
+"""
+Factory method and abstract factory dispatch.
+"""
+
+from abstract import CreditCardFactory, PayPalFactory
+from factory import pizza_shop, shipping_factory
+
+from .runner import benchmark
+
+
+SHIPPING_TYPES = ["standard", "express", "international", "sameday"]
+PIZZA_TYPES = ["cheese", "veggie"]
+
+
+@benchmark("factory.shipping_factory", number=10_000, ops=len(SHIPPING_TYPES))
+def shipping():
+    def run():
+        for shipping_type in SHIPPING_TYPES:
+            shipping_factory(shipping_type)
+    return run
+
+
+@benchmark("factory.pizza_shop", number=10_000, ops=len(PIZZA_TYPES))
+def pizza():
+    def run():
+        for pizza_type in PIZZA_TYPES:
+            pizza_shop(pizza_type)
+    return run
+
+
+@benchmark("abstract.payment_family", number=10_000, ops=2)
+def payment_family():
+    factories = [CreditCardFactory(), PayPalFactory()]
+
+    def run():
+        for factory in factories:
+            factory.create_payment()
+            factory.create_notification()
+    return run
@@ -0,0 +1,45 @@
+"""
+Cost of importing the packages, and of the first class lookup that loads the example module.
+
+Every measurement runs in a fresh interpreter, which times the import itself and reports it back,
+so nothing is dropped from this process's sys.modules (the .pyc files are still cached, like in a
+real service start). These numbers are for tracking; the import-time budget is enforced by
+tests/test_imports.py.
+"""
+
+import os
+import subprocess
+import sys
+
+from .runner import benchmark
+
+
+PACKAGES = {
+    "abstract": "PaymentFactory",
+    "adpater": "AnalyticsAdapter",
+    "builder": "Director",
+    "factory": "shipping_factory",
+    "singleton": "Singleton",
+}
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def cold_import(package, attribute=None):
+    lookup = f"; module.{attribute}" if attribute is not None else ""
+    code = ("from time import perf_counter; start = perf_counter(); "
+            f"import {package} as module{lookup}; print(perf_counter() - start)")
+
+    def setup():
+        def run():
+            result = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                                    capture_output=True, text=True, check=True)
+            return float(result.stdout)
+        return run
+    return setup
+
+
+for package, attribute in PACKAGES.items():
+    benchmark(f"imports.{package}", number=10, self_timed=True)(cold_import(package))
+    benchmark(f"imports.{package}.{attribute}", number=10, self_timed=True)(
+        cold_import(package, attribute))
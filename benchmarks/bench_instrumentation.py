@@ -0,0 +1,35 @@
+"""
+Cost of the metrics while they are turned on; the other benchmarks run with them off.
+"""
+
+from builder import Director, WoodenHouseBuilder
+from factory import shipping_factory
+from instrumentation import metrics
+
+from .runner import benchmark
+
+
+CALLS = 1_000
+
+
+def enabled(func):
+    def run():
+        metrics.enable()
+        try:
+            for _ in range(CALLS):
+                func()
+        finally:
+            metrics.disable()
+            metrics.reset()
+    return run
+
+
+@benchmark("instrumentation.shipping_factory", number=100, ops=CALLS)
+def shipping():
+    return enabled(lambda: shipping_factory("express"))
+
+
+@benchmark("instrumentation.construct_house", number=100, ops=CALLS)
+def construct_house():
+    # same work as builder.construct_house_fresh, with metrics on
+    return enabled(lambda: Director(WoodenHouseBuilder()).construct_house())
@@ -0,0 +1,69 @@
+"""
+Plugin index start-up cost as the number of plugin products grows.
+
+"warm" is a normal start: the on-disk index is reused, the plugin files are only stat'ed.
+"rescan" is the first start after a change: every plugin file is parsed again.
+"""
+
+import atexit
+import os
+import shutil
+import tempfile
+
+from design_patterns_plugins import PluginRegistry
+
+from .runner import benchmark
+
+
+PLUGIN_SOURCE = '''PRODUCTS = {{"shipping": {{"plugin_{i}": "PluginShipping{i}"}}}}
+
+from factory import Shipping
+
+
+class PluginShipping{i}(Shipping):
+    def calculate_cost(self):
+        return {i}.0
+'''
+
+
+def _temporary_directory(prefix):
+    directory = tempfile.mkdtemp(prefix=prefix)
+    atexit.register(shutil.rmtree, directory, True)
+    return directory
+
+
+def plugin_directory(count):
+    directory = _temporary_directory(f"plugins-{count}-")
+    for i in range(count):
+        with open(os.path.join(directory, f"plugin_{i}.py"), "w") as f:
+            f.write(PLUGIN_SOURCE.format(i=i))
+    # the cache lives outside the plugin directory, writing it must not change that directory
+    cache_path = os.path.join(_temporary_directory("plugin-cache-"), "index.cache")
+    return directory, cache_path
+
+
+def warm_start(count):
+    def setup():
+        directory, cache_path = plugin_directory(count)
+        PluginRegistry([directory], cache_path).index()
+
+        def run():
+            registry = PluginRegistry([directory], cache_path)
+            registry.load("shipping", "plugin_0")  # imports just this one plugin
+        return run
+    return setup
+
+
+def rescan(count):
+    def setup():
+        directory, cache_path = plugin_directory(count)
+
+        def run():
+            PluginRegistry([directory], cache_path, use_entry_points=False).refresh()
+        return run
+    return setup
+
+
+for count in (10, 100, 1000):
+    benchmark(f"plugins.warm_start.{count}", number=20)(warm_start(count))
+    benchmark(f"plugins.rescan.{count}", number=5)(rescan(count))
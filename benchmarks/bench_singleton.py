@@ -0,0 +1,85 @@
+"""
+Singleton() / SingletonMeta lookups, alone and from several threads at the same time.
+
+The threads are started once in setup and every timed call only releases them and waits for them,
+so thread start-up is not part of the numbers. Once the instance exists, Singleton() returns it
+without taking its lock: *_threads measures lookups under the GIL, not lock contention.
+singleton.new_race is the contended case, every thread asks for an instance that does not exist yet;
+compare it with singleton.threads_baseline, the same round with workers that do nothing.
+"""
+
+import threading
+
+from singleton import DatabaseConnection, Singleton
+
+from .runner import benchmark
+
+
+THREADS = 8
+CALLS = 10_000
+
+
+class _Workers:
+
+    def __init__(self, work, threads=THREADS):
+        # the benchmark thread is the extra party: it releases the round and waits for its end
+        self.start = threading.Barrier(threads + 1)
+        self.done = threading.Barrier(threads + 1)
+        for _ in range(threads):
+            threading.Thread(target=self._loop, args=(work,), daemon=True).start()
+
+    def _loop(self, work):
+        while True:
+            self.start.wait()
+            work()
+            self.done.wait()
+
+    def run(self):
+        self.start.wait()
+        self.done.wait()
+
+
+def repeated(make, calls=CALLS):
+    def work():
+        for _ in range(calls):
+            make()
+    return work
+
+
+class _RaceSingleton(Singleton):
+    pass
+
+
+@benchmark("singleton.new", number=100_000)
+def singleton_new():
+    return Singleton
+
+
+@benchmark("singleton.new_threads", number=20, ops=THREADS * CALLS)
+def singleton_new_threads():
+    return _Workers(repeated(Singleton)).run
+
+
+@benchmark("singleton.meta", number=100_000)
+def singleton_meta():
+    return DatabaseConnection
+
+
+@benchmark("singleton.meta_threads", number=20, ops=THREADS * CALLS)
+def singleton_meta_threads():
+    return _Workers(repeated(DatabaseConnection)).run
+
+
+@benchmark("singleton.threads_baseline", number=1000, ops=THREADS)
+def threads_baseline():
+    return _Workers(lambda: None).run
+
+
+@benchmark("singleton.new_race", number=1000, ops=THREADS)
+def singleton_new_race():
+    workers = _Workers(_RaceSingleton)
+
+    def run():
+        _RaceSingleton._instance = None  # every round starts before the first instance
+        workers.run()
+    return run
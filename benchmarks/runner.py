@@ -0,0 +1,151 @@
+"""
+Registry, timing loop, result files and compare mode for the benchmarks.
+
+A benchmark is a function that does its setup and returns the callable to time:
+
+    @benchmark("factory.shipping_factory", number=100_000)
+    def shipping():
+        return lambda: shipping_factory("express")
+
+The callable is run `number` times per repeat. `ops` says how many operations one call of it
+does (e.g. a call that builds 1000 houses has ops=1000), it is only used for ops/sec.
+Benchmarks marked heavy=True are skipped unless --heavy is given.
+
+With self_timed=True the callable measures itself and returns the seconds it took, for work whose
+interesting part runs elsewhere (e.g. an import timed inside a fresh interpreter).
+"""
+
+import json
+import platform
+import statistics
+import sys
+import time
+
+
+_registry = {}
+
+
+class Benchmark:
+
+    def __init__(self, name, setup, number=1, ops=1, heavy=False, self_timed=False):
+        self.name = name
+        self.setup = setup
+        self.number = number
+        self.ops = ops
+        self.heavy = heavy
+        self.self_timed = self_timed
+        self.group = name.split(".")[0]
+
+
+def benchmark(name, number=1, ops=1, heavy=False, self_timed=False):
+    def register(setup):
+        if name in _registry:
+            raise ValueError(f"Duplicate benchmark: {name}")
+        _registry[name] = Benchmark(name, setup, number=number, ops=ops, heavy=heavy,
+                                    self_timed=self_timed)
+        return setup
+    return register
+
+
+def benchmarks(pattern=None, heavy=False):
+    # heavy benchmarks (minutes, gigabytes) only run when asked for
+    return [b for name, b in sorted(_registry.items())
+            if (pattern is None or pattern in name) and (heavy or not b.heavy)]
+
+
+def run_benchmark(bench, warmup=1, repeat=5):
+    func = bench.setup()
+    number = bench.number
+    loop = range(number)
+    clock = time.perf_counter
+
+    for _ in range(warmup):
+        for _ in loop:
+            func()
+
+    times = []
+    for _ in range(repeat):
+        if bench.self_timed:
+            times.append(sum(func() for _ in loop) / number)
+            continue
+        start = clock()
+        for _ in loop:
+            func()
+        times.append((clock() - start) / number)
+
+    median = statistics.median(times)
+    return {
+        "group": bench.group,
+        "number": number,
+        "ops": bench.ops,
+        "repeat": repeat,
+        "times": times,
+        "min": min(times),
+        "median": median,
+        "mean": statistics.fmean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "ops_per_sec": bench.ops / median if median else float("inf"),
+    }
+
+
+def run_all(pattern=None, warmup=1, repeat=5, heavy=False, out=sys.stdout):
+    results = {}
+    for bench in benchmarks(pattern, heavy=heavy):
+        result = run_benchmark(bench, warmup=warmup, repeat=repeat)
+        results[bench.name] = result
+        print(f"{bench.name:45} {_format_time(result['median']):>10} "
+              f"± {_format_time(result['stdev']):>10}  {result['ops_per_sec']:>16,.0f} ops/sec",
+              file=out)
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "warmup": warmup,
+        "repeat": repeat,
+        "benchmarks": results,
+    }
+
+
+def save(results, path):
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(old, new, threshold=0.10, out=sys.stdout):
+    # returns the names of the benchmarks whose median got slower by more than threshold
+    old_benchmarks = old["benchmarks"]
+    new_benchmarks = new["benchmarks"]
+    regressions = []
+
+    for name in sorted(set(old_benchmarks) & set(new_benchmarks)):
+        before = old_benchmarks[name]["median"]
+        after = new_benchmarks[name]["median"]
+        change = (after - before) / before if before else 0.0
+        if change > threshold:
+            status = "REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            status = "faster"
+        else:
+            status = ""
+        print(f"{name:45} {_format_time(before):>10} -> {_format_time(after):>10} "
+              f"{change:+8.1%}  {status}", file=out)
+
+    for name in sorted(set(old_benchmarks) ^ set(new_benchmarks)):
+        where = "old" if name in old_benchmarks else "new"
+        print(f"{name:45} only in {where} results", file=out)
+
+    return regressions
+
+
+def _format_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e3), ("us", 1e6)):
+        if seconds >= 1 / scale:
+            return f"{seconds * scale:.2f} {unit}"
+    return f"{seconds * 1e9:.0f} ns"
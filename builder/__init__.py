@@ -0,0 +1,18 @@
+"""Builder pattern: houses built step by step by a Director. Run `python -m builder` for the walkthrough."""
+
+from lazy_exports import lazy_exports
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    "House": "builder",
+    "HouseBuilder": "builder",
+    "WoodenHouseBuilder": "builder",
+    "GlassHouseBuilder": "builder",
+    "Director": "builder",
+    "compile_plan": "builder",
+    "HouseWriter": "house_io",
+    "HouseReader": "house_io",
+    "dump": "house_io",
+    "dumps": "house_io",
+    "loads": "house_io",
+    "iter_file": "house_io",
+})
@@ -0,0 +1,53 @@
+"""
+Walkthrough of the builder example: python -m builder
+"""
+
+from .builder import Director, GlassHouseBuilder, WoodenHouseBuilder
+
+
+# with out builder pattern
+
+class House:
+
+    def __init__(self, walls, roof, windows, doors):
+
+        self.walls = walls
+        self.roof = roof
+        self.windows = windows
+        self.doors = doors
+
+    def display(self):
+        print(
+            f"House with {self.walls} walls, {self.roof} roof, {self.windows} windows, and {self.doors} doors.")
+
+
+wooden_house = House(walls="wooden", roof="wooden", windows=4, doors=1)
+glass_house = House(walls="glass", roof="glass", windows=10, doors=2)
+
+wooden_house.display()
+glass_house.display()
+
+
+"""
+Problems:
+
+The constructor (__init__) gets cluttered with too many parameters.
+Adding optional features (like a swimming pool) becomes messy.
+It's not clear what each parameter means without additional documentation.
+
+"""
+
+# lets write it using the builder pattern
+
+
+# Client Code
+wooden_builder = WoodenHouseBuilder()
+director = Director(wooden_builder)
+wooden_house = director.construct_house()
+wooden_house.display()
+
+
+glass_builder = GlassHouseBuilder()
+director = Director(glass_builder)
+glass_house = director.construct_house()
+glass_house.display()
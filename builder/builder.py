@@ -30,58 +30,82 @@ Doors
 
 """
 
+from time import perf_counter
 
-class House:
+from instrumentation import metrics
+
+
+# the product
 
-    def __init__(self, walls, roof, windows, doors):
 
-        self.walls = walls
-        self.roof = roof
-        self.windows = windows
-        self.doors = doors
+class House:
+
+    def __init__(self):
+        self.walls = None
+        self.roof = None
+        self.windows = None
+        self.doors = None
 
     def display(self):
         print(
             f"House with {self.walls} walls, {self.roof} roof, {self.windows} windows, and {self.doors} doors.")
 
+    def clone(self):
+        # prototype copy. Strings, numbers and None can be shared, so copying
+        # the attribute dict is enough; a house holding anything else (a list
+        # of rooms, ...) is deep-copied so the copy never shares it
+        if not _plain(self.__dict__):
+            import copy
 
-wooden_house = House(walls="wooden", roof="wooden", windows=4, doors=1)
-glass_house = House(walls="glass", roof="glass", windows=10, doors=2)
+            return copy.deepcopy(self)
+        house = object.__new__(self.__class__)
+        house.__dict__ = self.__dict__.copy()
+        return house
 
-wooden_house.display()
-glass_house.display()
+    def clones(self, n):
+        # n independent copies, like n calls of clone() with the check done once
+        if not _plain(self.__dict__):
+            import copy
 
+            return [copy.deepcopy(self) for _ in range(n)]
+        cls = self.__class__
+        state = self.__dict__
+        new = object.__new__
 
-"""
-Problems:
+        houses = []
+        for _ in range(n):
+            house = new(cls)
+            house.__dict__ = state.copy()
+            houses.append(house)
+        return houses
 
-The constructor (__init__) gets cluttered with too many parameters.
-Adding optional features (like a swimming pool) becomes messy.
-It's not clear what each parameter means without additional documentation.
 
-"""
+# field values that can be shared between houses: immutable scalars only
+# (exact types, a subclass could add mutable attributes)
+_PLAIN_TYPES = frozenset({str, int, float, complex, bool, bytes, type(None)})
 
-# lets write it using the builder pattern
 
-# the product
+def _plain(fields):
+    return all(type(value) in _PLAIN_TYPES for value in fields.values())
 
 
-class House:
+# builder interface
 
-    def __init__(self):
-        self.walls = None
-        self.roof = None
-        self.windows = None
-        self.doors = None
+class _BuilderType(type):
+    # replacing a build step on any builder class makes every compiled plan
+    # stale (see compile_plan below); subclasses are covered too, because the
+    # counter is shared
 
-    def display(self):
-        print(
-            f"House with {self.walls} walls, {self.roof} roof, {self.windows} windows, and {self.doors} doors.")
+    def __setattr__(cls, name, value):
+        super().__setattr__(name, value)
+        _invalidate_plans(name)
 
+    def __delattr__(cls, name):
+        super().__delattr__(name)
+        _invalidate_plans(name)
 
-# builder interface
 
-class HouseBuilder:
+class HouseBuilder(metaclass=_BuilderType):
 
     def build_walls(self):
         pass
@@ -149,26 +173,174 @@ class Director:
 
     def __init__(self, builder):
         self.builder = builder
+        self._plan = None
+        self._plan_builder = None
+        self._plan_version = -1
 
     def construct_house(self):
+        if metrics.enabled:
+            return self._construct_house_measured()
         self.builder.build_walls()
         self.builder.build_roof()
         self.builder.build_windows()
         self.builder.build_doors()
         return self.builder.get_house()
 
-
-# Client Code
-wooden_builder = WoodenHouseBuilder()
-director = Director(wooden_builder)
-wooden_house = director.construct_house()
-wooden_house.display()
-
-
-glass_builder = GlassHouseBuilder()
-director = Director(glass_builder)
-glass_house = director.construct_house()
-glass_house.display()
+    def _construct_house_measured(self):
+        # same steps as construct_house(), with every step timed on its own
+        start = perf_counter()
+        builder_name = self.builder.__class__.__name__
+        try:
+            for step in ("build_walls", "build_roof", "build_windows", "build_doors"):
+                step_start = perf_counter()
+                try:
+                    getattr(self.builder, step)()
+                finally:
+                    metrics.observe(f"builder.{builder_name}.{step}", step_start)
+            return self.builder.get_house()
+        finally:
+            metrics.observe("builder.Director.construct_house", start)
+
+    def construct_many(self, n):
+        # the concrete builders keep filling the same self.house, so calling
+        # construct_house() n times would give back one object n times.
+        # Instead run the steps once to get a prototype and stamp out copies
+        # (the prototype itself stays with the builder and is not returned).
+        start = metrics.enabled and perf_counter()
+        try:
+            return self.construct_house().clones(n)
+        finally:
+            if start:
+                metrics.observe("builder.Director.construct_many", start)
+
+    def construct_compiled(self):
+        # same house as construct_house(), but built by the compiled plan of
+        # this director's builder (see compile_plan below).
+        # This method only runs on the first call, after a build step was
+        # patched or the builder replaced, and while metrics are on. It
+        # installs the plan, with those checks fused in, as the instance's
+        # construct_compiled, so every other call is one generated function.
+        start = metrics.enabled and perf_counter()
+        try:
+            if self._plan_version != _plan_state[0] or self._plan_builder is not self.builder:
+                plan, guarded = _compile(self.builder)
+                self._plan = plan
+                self._plan_builder = self.builder
+                self._plan_version = _plan_state[0]
+                self.__dict__["construct_compiled"] = guarded(
+                    Director.construct_compiled.__get__(self), self, self.builder)
+            return self._plan()
+        finally:
+            if start:
+                metrics.observe("builder.Director.construct_compiled", start)
+
+
+# compiled construction plans
+#
+# WoodenHouseBuilder and GlassHouseBuilder always produce the same field values,
+# so there is no need to replay four build_* calls for every house.
+# compile_plan() runs the Director's steps once on a copy of the builder,
+# records the fields of the resulting house and generates one function that
+# creates the house and sets all of its fields in one go.
+#
+# This only works for builders whose steps always set the same values.
+# Strings, numbers and None are shared between the houses a plan builds; any
+# other value (a list, ...) is deep-copied for every house, like House.clone().
+#
+# Plans are compiled from the builder instance, so a builder configured through
+# its own attributes gets its own plan. Configure the builder before the first
+# construct_compiled() call; a Director does not notice later changes to its
+# builder's attributes. Replacing a build step on a HouseBuilder class (or any
+# subclass), or giving the Director another builder, does invalidate its plan.
+#
+# The fields are set one by one rather than with house.__dict__ = fields.copy():
+# on CPython 3.11 replacing the dict of a new object measured slower than four
+# stores into its inline attribute values.
+
+_PLAN_METHODS = ("__init__", "build_walls", "build_roof",
+                 "build_windows", "build_doors", "get_house")
+
+# [version]; a list so that generated functions can hold it and see it change
+_plan_state = [0]
+_plan_cache = {}
+
+
+def _invalidate_plans(name):
+    if name in _PLAN_METHODS:
+        _plan_state[0] += 1
+        _plan_cache.clear()
+
+
+def _plan_key(builder):
+    # the builder's class and configuration; None when the configuration
+    # cannot be used as a dict key (then the plan is simply not shared)
+    state = tuple(sorted((name, value) for name, value in vars(builder).items()
+                         if name != "house"))
+    try:
+        hash(state)
+    except TypeError:
+        return None
+    return builder.__class__, state
+
+
+def compile_plan(builder):
+    # builder is a builder instance (left untouched, the steps run on a copy);
+    # a builder class is accepted too and is then created with no arguments
+    return _compile(builder)[0]
+
+
+def _compile(builder):
+    # (plan, guarded): guarded(fallback, director, builder) is the plan with a
+    # check in front that calls fallback() instead once the plan is stale, the
+    # director got another builder or metrics are on
+    import copy
+
+    builder = builder() if isinstance(builder, type) else copy.deepcopy(builder)
+
+    key = _plan_key(builder)
+    compiled = _plan_cache.get(key) if key is not None else None
+    if compiled is not None:
+        return compiled
+
+    house = Director(builder).construct_house()
+
+    # everything the function needs is bound as a default argument, so it is
+    # read as a local instead of a global (and values never go through repr())
+    namespace = {"_new": object.__new__, "_product": house.__class__,
+                 "_state": _plan_state, "_version": _plan_state[0], "_metrics": metrics}
+    params = ["_new=_new", "_product=_product"]
+    body = ["house = _new(_product)"]
+    for i, (field, value) in enumerate(house.__dict__.items()):
+        namespace[f"_v{i}"] = value
+        params.append(f"_v{i}=_v{i}")
+        if type(value) in _PLAIN_TYPES:
+            body.append(f"house.{field} = _v{i}")
+        else:
+            namespace["_deepcopy"] = copy.deepcopy
+            body.append(f"house.{field} = _deepcopy(_v{i})")
+    body.append("return house")
+
+    name = f"construct_{builder.__class__.__name__}"
+    guard_params = params + ["_state=_state", "_version=_version", "_metrics=_metrics",
+                             "_director=_director", "_builder=_builder"]
+    source = "\n".join([
+        f"def {name}({', '.join(params)}):",
+        *(f"    {line}" for line in body),
+        "",
+        "def guarded(_fallback, _director, _builder):",
+        f"    def {name}({', '.join(guard_params)}):",
+        "        if (_state[0] != _version or _metrics.enabled",
+        "                or _director.builder is not _builder):",
+        "            return _fallback()",
+        *(f"        {line}" for line in body),
+        f"    return {name}",
+    ])
+    exec(source, namespace)
+    compiled = namespace[name], namespace["guarded"]
+
+    if key is not None:
+        _plan_cache[key] = compiled
+    return compiled
 
 
 """
@@ -0,0 +1,304 @@
+"""
+
+Binary records for the House product.
+
+Pickling or json-dumping every House one by one is slow when there are millions of them.
+A House only has four fields, so every house is written as one fixed-size record:
+
+    walls (material id) | roof (material id) | windows | doors
+
+The materials ("wooden", "glass", ...) are strings and repeat a lot, so they are stored once
+in a material dictionary and the records only keep their index.
+
+File layout:
+
+    header      magic + version
+    records     count * RECORD.size bytes
+    materials   count + (length, utf-8 bytes) for every material
+    footer      record count + offset of the materials + magic
+
+Because every record has the same size, record i starts at HEADER.size + i * RECORD.size,
+so the reader can jump to any house without scanning the ones before it.
+The footer is written last, which lets the writer stream houses without knowing how many will come.
+
+The reader finds the footer at the end of the data it is given. When writing into a pre-allocated
+buffer, hand the reader only the part that was written; close() returns its length:
+
+    buffer = bytearray(1 << 20)
+    writer = HouseWriter(buffer)
+    writer.write_many(houses)
+    reader = HouseReader(memoryview(buffer)[:writer.close()])
+
+HouseReader needs the whole file (bytes, or an mmap that the OS pages in on demand).
+iter_file(f) streams a seekable file instead: it reads the footer and the material dictionary
+once, then the records CHUNK_RECORDS at a time, so memory stays flat however big the file is.
+A pipe or socket cannot be read this way, since the materials only arrive at the end.
+
+A `with HouseWriter(...)` block that ends with an exception writes no footer, so a dump cut short
+is rejected by the readers instead of passing for a complete file.
+
+"""
+
+import io
+import mmap
+import struct
+
+from .builder import House
+
+
+MAGIC = b"HOUS"
+VERSION = 1
+
+HEADER = struct.Struct("<4sH2x")
+RECORD = struct.Struct("<HHii")
+FOOTER = struct.Struct("<IQ4s")
+LENGTH = struct.Struct("<H")
+COUNT = struct.Struct("<I")
+
+# None is a valid value for every field (a House() before the builder ran)
+NO_MATERIAL = 0xFFFF
+NO_NUMBER = -2 ** 31
+
+# records are packed into a chunk and flushed together instead of one write per house
+CHUNK_RECORDS = 4096
+
+
+class _BufferSink:
+    # lets the writer target a pre-allocated bytearray / memoryview like a file
+
+    def __init__(self, buffer):
+        self.buffer = memoryview(buffer).cast("B")
+        self.position = 0
+
+    def write(self, data):
+        end = self.position + len(data)
+        if end > len(self.buffer):
+            raise ValueError("House buffer is too small")
+        self.buffer[self.position:end] = data
+        self.position = end
+        return len(data)
+
+
+class HouseWriter:
+
+    def __init__(self, target):
+        # target is a binary file object, or a writable buffer
+        self.sink = target if hasattr(target, "write") else _BufferSink(target)
+        self.materials = {}
+        self.count = 0
+        self.size = 0
+        self.chunk = bytearray()
+        self.closed = False
+        self._write(HEADER.pack(MAGIC, VERSION))
+
+    def _write(self, data):
+        self.sink.write(data)
+        self.size += len(data)
+
+    def _material(self, name):
+        if name is None:
+            return NO_MATERIAL
+        index = self.materials.get(name)
+        if index is None:
+            index = len(self.materials)
+            if index >= NO_MATERIAL:
+                raise ValueError("Too many distinct materials")
+            self.materials[name] = index
+        return index
+
+    def write(self, house):
+        self.chunk += RECORD.pack(
+            self._material(house.walls),
+            self._material(house.roof),
+            NO_NUMBER if house.windows is None else house.windows,
+            NO_NUMBER if house.doors is None else house.doors,
+        )
+        self.count += 1
+        if len(self.chunk) >= CHUNK_RECORDS * RECORD.size:
+            self.flush()
+
+    def write_many(self, houses):
+        for house in houses:
+            self.write(house)
+
+    def flush(self):
+        if self.chunk:
+            self._write(self.chunk)
+            self.chunk = bytearray()
+
+    def close(self):
+        # returns the number of bytes written
+        if self.closed:
+            return self.size
+        self.flush()
+
+        materials_offset = self.size
+        table = bytearray(COUNT.pack(len(self.materials)))
+        for name in self.materials:
+            encoded = name.encode("utf-8")
+            table += LENGTH.pack(len(encoded))
+            table += encoded
+        self._write(table)
+        self._write(FOOTER.pack(self.count, materials_offset, MAGIC))
+        self.closed = True
+        return self.size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        if exc_type is None:
+            self.close()
+        else:
+            self.closed = True  # no footer, the data is incomplete
+
+
+def _check(header, footer, size):
+    # (count, materials offset) from the header and footer of a file of `size` bytes
+    magic, version = HEADER.unpack(header)
+    count, materials_offset, end_magic = FOOTER.unpack(footer)
+    if magic != MAGIC or end_magic != MAGIC:
+        raise ValueError("Not a House file: bad magic")
+    if version != VERSION:
+        raise ValueError(f"Unsupported House file version: {version}")
+    if (HEADER.size + count * RECORD.size != materials_offset
+            or materials_offset > size - FOOTER.size):
+        raise ValueError("Corrupt House file: record count does not match")
+    return count, materials_offset
+
+
+def _read_materials(view, offset):
+    (count,) = COUNT.unpack_from(view, offset)
+    offset += COUNT.size
+    materials = []
+    for _ in range(count):
+        (length,) = LENGTH.unpack_from(view, offset)
+        offset += LENGTH.size
+        materials.append(str(view[offset:offset + length], "utf-8"))
+        offset += length
+    return materials
+
+
+def _decoder(materials):
+    # record fields -> House, for one file's material dictionary
+    new = object.__new__
+
+    def house(walls, roof, windows, doors):
+        house = new(House)
+        house.walls = None if walls == NO_MATERIAL else materials[walls]
+        house.roof = None if roof == NO_MATERIAL else materials[roof]
+        house.windows = None if windows == NO_NUMBER else windows
+        house.doors = None if doors == NO_NUMBER else doors
+        return house
+    return house
+
+
+class HouseReader:
+
+    def __init__(self, data):
+        # data is bytes, bytearray, memoryview or an mmap; nothing is copied
+        self.view = memoryview(data).cast("B")
+        self._mmap = None
+        self._iterators = set()
+
+        size = len(self.view)
+        if size < HEADER.size + FOOTER.size:
+            raise ValueError("Not a House file: too short")
+        count, materials_offset = _check(
+            self.view[:HEADER.size], self.view[size - FOOTER.size:], size)
+
+        self.count = count
+        self.materials = _read_materials(self.view, materials_offset)
+        self._house = _decoder(self.materials)
+
+    @classmethod
+    def open(cls, path, use_mmap=True):
+        with open(path, "rb") as f:
+            if not use_mmap:
+                return cls(f.read())
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        reader = cls(mapped)
+        reader._mmap = mapped
+        return reader
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("House index out of range")
+        return self._house(*RECORD.unpack_from(self.view, HEADER.size + index * RECORD.size))
+
+    def __iter__(self):
+        # iterators that are still open are closed by close(), so their views do not pin the mmap
+        self._iterators = {it for it in self._iterators if it.gi_frame is not None}
+        iterator = self._iter_records()
+        self._iterators.add(iterator)
+        return iterator
+
+    def _iter_records(self):
+        records = self.view[HEADER.size:HEADER.size + self.count * RECORD.size]
+        house = self._house
+        try:
+            for fields in RECORD.iter_unpack(records):
+                yield house(*fields)
+        finally:
+            records.release()
+
+    def close(self):
+        # safe to call more than once
+        for iterator in self._iterators:
+            iterator.close()
+        self._iterators = set()
+        self.view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def iter_file(f):
+    # houses of a seekable binary file, read CHUNK_RECORDS records at a time
+    size = f.seek(0, io.SEEK_END)
+    if size < HEADER.size + FOOTER.size:
+        raise ValueError("Not a House file: too short")
+    f.seek(0)
+    header = f.read(HEADER.size)
+    f.seek(size - FOOTER.size)
+    count, materials_offset = _check(header, f.read(FOOTER.size), size)
+
+    f.seek(materials_offset)
+    house = _decoder(_read_materials(f.read(size - FOOTER.size - materials_offset), 0))
+
+    f.seek(HEADER.size)
+    remaining = count
+    while remaining:
+        records = min(remaining, CHUNK_RECORDS)
+        chunk = f.read(records * RECORD.size)
+        if len(chunk) != records * RECORD.size:
+            raise ValueError("Corrupt House file: truncated records")
+        for fields in RECORD.iter_unpack(chunk):
+            yield house(*fields)
+        remaining -= records
+
+
+def dump(houses, f):
+    with HouseWriter(f) as writer:
+        writer.write_many(houses)
+
+
+def dumps(houses):
+    buffer = io.BytesIO()
+    dump(houses, buffer)
+    return buffer.getvalue()
+
+
+def loads(data):
+    return list(HouseReader(data))
@@ -0,0 +1,14 @@
+"""
+Plugin products for the factories: shipping types, pizzas and payment families.
+
+    import design_patterns_plugins as plugins
+
+    plugins.names("shipping")              # what is installed, from the cached index
+    plugins.load("shipping", "overnight")  # imports the plugin module on first use
+
+See design_patterns_plugins/discovery.py for where plugins come from and how the index is cached.
+"""
+
+from .discovery import PluginRegistry, load, names, registry
+
+__all__ = ["PluginRegistry", "registry", "load", "names"]
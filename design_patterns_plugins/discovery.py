@@ -0,0 +1,274 @@
+"""
+Plugin discovery for factory products.
+
+Adding a shipping type, a pizza or a payment family should not mean editing factory.py or abstract.py,
+and importing every product module up front gets slower as the catalog grows. So products are found
+from metadata only, and a module is imported the first time one of its products is asked for.
+
+Products come from two places:
+
+1. Entry points of installed packages, in the group "design_patterns.<kind>":
+
+       [project.entry-points."design_patterns.shipping"]
+       overnight = "acme_shipping:OvernightShipping"
+
+2. Python files in the plugin directories (DESIGN_PATTERNS_PLUGIN_PATH, separated like PATH).
+   A file declares its products in a literal PRODUCTS dict, read with ast without importing the file:
+
+       PRODUCTS = {"shipping": {"overnight": "OvernightShipping"}}
+
+       class OvernightShipping(Shipping):
+           ...
+
+Kinds used by this repo: "shipping" and "pizza" (factory.py), "payment" (abstract.py).
+A plugin file that cannot be read (a syntax error, PRODUCTS that is not a literal dict of dicts)
+is skipped with a warning that names it; the other plugins keep working.
+
+The index (kind -> name -> where to find it) is saved in DESIGN_PATTERNS_PLUGIN_CACHE. The default,
+~/.cache/design-patterns/plugins-<python version>-<hash>.cache, is keyed by a hash of sys.prefix and
+sys.path, so two environments or projects do not keep overwriting each other's index.
+
+On the next start the index is reused as long as the plugin directories and the sys.path entries that
+hold distributions (directories with *.dist-info / *.egg-info in them, zip and egg files) have not
+changed. The script directory and the working directory only count if packages are installed there,
+so a log or results file written next to the script does not throw the index away. That check is
+one stat per directory, not per file, so start-up stays flat however many products there are, and a
+cold start neither parses plugin files nor imports importlib.metadata. The file is written with
+marshal, which is built in, so reading it does not pay for importing json either.
+
+The first lookup in a process that needs the index pays for the check above. When there is no
+usable cache (first run, a new package installed, a plugin file added) it also reads the metadata of
+every installed distribution and writes the cache file, which takes milliseconds instead of microseconds.
+
+Adding, removing or renaming a plugin file changes its directory's mtime and is picked up on its own,
+and so does installing or removing a package in a directory that already holds distributions.
+Editing PRODUCTS inside an existing file in place is not, nor is the first package installed into a
+sys.path directory that had none; call registry.refresh() after doing that.
+"""
+
+import marshal
+import os
+import sys
+
+
+ENTRY_POINT_PREFIX = "design_patterns."
+INDEX_VERSION = 2
+DISTRIBUTION_SUFFIXES = (".dist-info", ".egg-info")
+
+
+def _default_directories():
+    path = os.environ.get("DESIGN_PATTERNS_PLUGIN_PATH", "")
+    return [d for d in path.split(os.pathsep) if d]
+
+
+def _default_cache_path():
+    path = os.environ.get("DESIGN_PATTERNS_PLUGIN_CACHE")
+    if path:
+        return path
+    from binascii import crc32
+
+    environment = crc32(repr((sys.prefix, sys.path)).encode("utf-8"))
+    name = f"plugins-{sys.version_info[0]}{sys.version_info[1]}-{environment:08x}.cache"
+    return os.path.join(os.path.expanduser("~"), ".cache", "design-patterns", name)
+
+
+class PluginRegistry:
+
+    def __init__(self, directories=None, cache_path=None, use_entry_points=True):
+        self.directories = [os.path.abspath(d) for d in (
+            _default_directories() if directories is None else directories)]
+        self.cache_path = _default_cache_path() if cache_path is None else cache_path
+        self.use_entry_points = use_entry_points
+        self._index = None
+        self._loaded = {}
+
+    # index
+
+    def _fingerprint(self, paths):
+        # what the index depends on: one stat per directory, nothing is read or imported.
+        # paths are the sys.path entries that hold distributions (see _distribution_paths)
+        directories = {}
+        for directory in self.directories:
+            try:
+                directories[directory] = os.stat(directory).st_mtime_ns
+            except OSError:
+                pass
+
+        # installing or removing a package changes the mtime of its sys.path directory
+        stats = {}
+        for path in paths:
+            try:
+                stats[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                pass
+
+        return {"version": INDEX_VERSION, "directories": directories, "sys_path": stats}
+
+    def _distribution_paths(self):
+        # sys.path entries packages can be installed in: zip/egg files, and directories that hold
+        # *.dist-info or *.egg-info. Listing the directories is only done when the index is rebuilt
+        if not self.use_entry_points:
+            return []
+        paths = []
+        for entry in sys.path:
+            path = os.path.abspath(entry or ".")
+            if os.path.isfile(path):
+                paths.append(path)
+                continue
+            try:
+                names = os.listdir(path)
+            except OSError:
+                continue
+            if any(name.endswith(DISTRIBUTION_SUFFIXES) for name in names):
+                paths.append(path)
+        return paths
+
+    def _scan_entry_points(self, index):
+        from importlib.metadata import distributions
+
+        for distribution in distributions():
+            for entry_point in distribution.entry_points:
+                if entry_point.group.startswith(ENTRY_POINT_PREFIX):
+                    kind = entry_point.group[len(ENTRY_POINT_PREFIX):]
+                    index.setdefault(kind, {}).setdefault(entry_point.name, entry_point.value)
+
+    def _scan_file(self, path, index):
+        import ast
+
+        with open(path, "rb") as f:
+            tree = ast.parse(f.read(), path)
+        for node in tree.body:
+            if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                    and isinstance(node.targets[0], ast.Name) and node.targets[0].id == "PRODUCTS"):
+                try:
+                    products = ast.literal_eval(node.value)
+                except ValueError:
+                    raise ValueError(f"PRODUCTS in {path} must be a literal dict") from None
+                if not (isinstance(products, dict) and all(
+                        isinstance(names, dict) and all(isinstance(a, str) for a in names.values())
+                        for names in products.values())):
+                    raise ValueError(f"PRODUCTS in {path} must map kind -> name -> attribute name")
+                for kind, names in products.items():
+                    for name, attribute in names.items():
+                        index.setdefault(kind, {})[name] = f"{path}:{attribute}"
+                return
+
+    def _scan(self, fingerprint):
+        index = {}
+        if self.use_entry_points:
+            self._scan_entry_points(index)
+        # local plugin files win over installed packages
+        for directory in fingerprint["directories"]:
+            for name in sorted(os.listdir(directory)):
+                path = os.path.join(directory, name)
+                if name.endswith(".py") and os.path.isfile(path):
+                    try:
+                        self._scan_file(path, index)
+                    except (OSError, SyntaxError, ValueError) as error:
+                        # one broken file must not take every other plugin down with it
+                        import warnings
+
+                        warnings.warn(f"Skipping plugin file {path}: {error}", RuntimeWarning)
+        return index
+
+    def _read_cache(self):
+        try:
+            # one read + loads(); marshal.load(f) reads the file in small pieces
+            with open(self.cache_path, "rb") as f:
+                cached = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        return cached if isinstance(cached, dict) else None
+
+    def _write_cache(self, cached):
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(marshal.dumps(cached))
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass  # a read-only home only costs a rescan next time
+
+    def index(self):
+        if self._index is None:
+            cached = self._read_cache()
+            if cached is not None and self._is_current(cached.get("fingerprint")):
+                self._index = cached["index"]
+            else:
+                self._rebuild(self._fingerprint(self._distribution_paths()))
+        return self._index
+
+    def _is_current(self, fingerprint):
+        # re-stat what the cached index was built from
+        if not isinstance(fingerprint, dict) or fingerprint.get("version") != INDEX_VERSION:
+            return False
+        return fingerprint == self._fingerprint(fingerprint.get("sys_path", ()))
+
+    def _rebuild(self, fingerprint):
+        self._index = self._scan(fingerprint)
+        self._write_cache({"fingerprint": fingerprint, "index": self._index})
+
+    def refresh(self):
+        # rescan now, whatever the cache says
+        self._loaded = {}
+        self._rebuild(self._fingerprint(self._distribution_paths()))
+
+    # lookups
+
+    def names(self, kind):
+        return sorted(self.index().get(kind, ()))
+
+    def load(self, kind, name):
+        # the product registered under kind/name, or None; imports its module on first use
+        key = (kind, name)
+        if key in self._loaded:
+            return self._loaded[key]
+
+        target = self.index().get(kind, {}).get(name)
+        if target is None:
+            return None
+
+        module_name, _, attribute = target.rpartition(":")
+        if module_name.endswith(".py"):
+            module = _import_file(module_name)
+        else:
+            import importlib
+
+            module = importlib.import_module(module_name)
+
+        product = module
+        for part in attribute.split("."):
+            product = getattr(product, part)
+        self._loaded[key] = product
+        return product
+
+
+def _import_file(path):
+    import importlib.util
+
+    module_name = "design_patterns_plugin_" + os.path.splitext(os.path.basename(path))[0]
+    module = sys.modules.get(module_name)
+    if module is not None and getattr(module, "__file__", None) == path:
+        return module
+
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+
+registry = PluginRegistry()
+
+
+def load(kind, name):
+    return registry.load(kind, name)
+
+
+def names(kind):
+    return registry.names(kind)
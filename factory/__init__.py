@@ -0,0 +1,16 @@
+"""Factory Method pattern: pizzas and shipping types. Run `python -m factory` for the walkthrough."""
+
+from lazy_exports import lazy_exports
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    "Pizza": "factory",
+    "CheesePizza": "factory",
+    "VeggiePizza": "factory",
+    "pizza_shop": "factory",
+    "Shipping": "factory",
+    "StandardShipping": "factory",
+    "ExpressShipping": "factory",
+    "InternationalShipping": "factory",
+    "SameDayShipping": "factory",
+    "shipping_factory": "factory",
+})
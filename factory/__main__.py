@@ -0,0 +1,48 @@
+"""
+Walkthrough of the factory examples: python -m factory
+"""
+
+from .factory import (ExpressShipping, InternationalShipping, SameDayShipping,
+                      StandardShipping, pizza_shop, shipping_factory)
+
+
+my_pizza = pizza_shop('cheese')
+my_pizza.prepare()
+
+
+# client code:
+
+def process_order(order_type):
+    shipping = shipping_factory(order_type)
+    print(f"Shipping cost: ${shipping.calculate_cost()}")
+
+
+process_order("standard")
+process_order("express")
+process_order("international")
+
+# added later
+process_order('sameday')
+
+
+#  now if you want to add new type of shipping you can just add the same in the factory method and write the class for it
+# and ask client to pass that value to get the cost for that shipping type
+
+
+# without factory
+
+def process_order_without_factory(order_type):
+
+    if order_type == 'standard':
+        shipping = StandardShipping()
+    elif order_type == 'express':
+        shipping = ExpressShipping()
+    elif order_type == 'internatitonal':
+        shipping = InternationalShipping()
+    elif order_type == 'sameday':
+        shipping = SameDayShipping()
+    else:
+        raise ValueError(f"Unknown shipping type: {order_type}")
+
+# As we can see here, the client needs to know which specific class or function to call for a given shipping type.
+# This leads to repetitive if-else conditions every time this logic is needed, making the code harder to maintain and extend.
@@ -17,6 +17,11 @@ You, the customer, don't care how the pizza is made; you just want the right typ
 
 """
 
+from time import perf_counter
+
+import design_patterns_plugins as plugins
+from instrumentation import metrics
+
 
 class Pizza:
     def __init__(self, name):
@@ -37,17 +42,23 @@ class VeggiePizza(Pizza):
 
 
 def pizza_shop(pizza_type):
-
-    if pizza_type == 'cheese':
-        return CheesePizza()
-    elif pizza_type == "veggie":
-        return VeggiePizza()
-    else:
-        raise ValueError("Unknown pizza type!")
-
-
-my_pizza = pizza_shop('cheese')
-my_pizza.prepare()
+    start = metrics.enabled and perf_counter()
+    try:
+        if pizza_type == 'cheese':
+            return CheesePizza()
+        elif pizza_type == "veggie":
+            return VeggiePizza()
+
+        # new pizzas come from plugins (see design_patterns_plugins/discovery.py), not from
+        # more elifs here. The first unknown type in a process loads the plugin index; without
+        # a valid cache that scans every installed distribution and writes ~/.cache/design-patterns
+        product = plugins.load("pizza", pizza_type)
+        if product is None:
+            raise ValueError("Unknown pizza type!")
+        return product()
+    finally:
+        if start:
+            metrics.observe("factory.pizza_shop", start)
 
 
 #############################################################################################
@@ -100,53 +111,23 @@ class SameDayShipping(Shipping):
 
 
 def shipping_factory(shipping_type):
-
-    if shipping_type == 'standard':
-        return StandardShipping()
-    elif shipping_type == 'express':
-        return ExpressShipping()
-
-    elif shipping_type == 'international':
-        return InternationalShipping()
-    elif shipping_type == 'sameday':
-        return SameDayShipping()
-    else:
-        raise ValueError(f"Unknown shipping type: {shipping_type}")
-
-
-# client code:
-
-def process_order(order_type):
-    shipping = shipping_factory(order_type)
-    print(f"Shipping cost: ${shipping.calculate_cost()}")
-
-
-process_order("standard")
-process_order("express")
-process_order("international")
-
-# added later
-process_order('sameday')
-
-
-#  now if you want to add new type of shipping you can just add the same in the factory method and write the class for it
-# and ask client to pass that value to get the cost for that shipping type
-
-
-# without factory
-
-def process_order(order_type):
-
-    if order_type == 'standard':
-        shipping = StandardShipping()
-    elif order_type == 'express':
-        shipping = ExpressShipping()
-    elif order_type == 'internatitonal':
-        shipping = InternationalShipping()
-    elif order_type == 'sameday':
-        shipping = SameDayShipping()
-    else:
-        raise ValueError(f"Unknown shipping type: {order_type}")
-
-# As we can see here, the client needs to know which specific class or function to call for a given shipping type.
-# This leads to repetitive if-else conditions every time this logic is needed, making the code harder to maintain and extend.
+    start = metrics.enabled and perf_counter()
+    try:
+        if shipping_type == 'standard':
+            return StandardShipping()
+        elif shipping_type == 'express':
+            return ExpressShipping()
+
+        elif shipping_type == 'international':
+            return InternationalShipping()
+        elif shipping_type == 'sameday':
+            return SameDayShipping()
+
+        # unknown types go to the plugins, see pizza_shop for what the first one costs
+        product = plugins.load("shipping", shipping_type)
+        if product is None:
+            raise ValueError(f"Unknown shipping type: {shipping_type}")
+        return product()
+    finally:
+        if start:
+            metrics.observe("factory.shipping_factory", start)
@@ -0,0 +1,17 @@
+"""
+Opt-in metrics for the factories, builders and adapters.
+
+    from instrumentation import metrics, export_text
+
+    metrics.enable()
+    ...
+    print(export_text())
+
+    with metrics.profile("run.prof"):
+        ...
+"""
+
+from .export import export_json, export_text
+from .registry import BUCKETS, Histogram, MetricsRegistry, metrics
+
+__all__ = ["BUCKETS", "Histogram", "MetricsRegistry", "metrics", "export_json", "export_text"]
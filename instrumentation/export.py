@@ -0,0 +1,25 @@
+"""
+Text and JSON exporters for the metrics registry.
+"""
+
+from .registry import metrics
+
+
+def export_json(registry=metrics, indent=2):
+    import json
+
+    return json.dumps(registry.snapshot(), indent=indent)
+
+
+def export_text(registry=metrics):
+    lines = [f"{'name':45} {'count':>10} {'mean':>10} {'p50':>10} {'p99':>10} {'max':>10} {'bytes':>12}"]
+    for name, stats in registry.snapshot().items():
+        lines.append(
+            f"{name:45} {stats['count']:>10} {_us(stats['mean'])} {_us(stats['p50'])} "
+            f"{_us(stats['p99'])} {_us(stats['max'])} {stats['bytes']:>12}")
+    return "\n".join(lines)
+
+
+def _us(seconds):
+    # microseconds, right aligned in 10 columns
+    return f"{'-':>10}" if seconds is None else f"{seconds * 1e6:>8.1f}us"
@@ -0,0 +1,129 @@
+"""
+Process-wide metrics registry.
+
+The factories, Director and adapters report into `metrics`. It is off by default, and while it is
+off every instrumented call pays for a single `metrics.enabled` check:
+
+    start = metrics.enabled and perf_counter()
+    try:
+        ... the real work ...
+    finally:
+        if start:
+            metrics.observe("factory.shipping_factory", start)
+
+The observe() sits in a finally so that calls which raise are counted too.
+
+Turn it on with metrics.enable(), read the numbers with metrics.snapshot() or the exporters.
+"""
+
+import bisect
+from _thread import allocate_lock  # threading.Lock without importing threading
+from time import perf_counter
+
+
+# upper bounds of the latency buckets, in seconds (10ns ... 10s); the last bucket is open ended.
+# A factory call takes well under a microsecond, so the scale starts below that
+BUCKETS = tuple(float(f"{base}e{exp}") for exp in range(-8, 1) for base in (1, 2.5, 5)) + (10.0,)
+
+
+class Histogram:
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.bytes = 0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+    def add(self, seconds, nbytes=0):
+        self.count += 1
+        self.total += seconds
+        self.bytes += nbytes
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+        self.buckets[bisect.bisect_left(BUCKETS, seconds)] += 1
+
+    def percentile(self, fraction):
+        # upper bound of the bucket the percentile falls in, capped at the largest value seen
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return min(BUCKETS[i], self.max) if i < len(BUCKETS) else self.max
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.percentile(0.50),
+            "p99": self.percentile(0.99),
+            "bytes": self.bytes,
+            "buckets": dict(zip([str(b) for b in BUCKETS] + ["inf"], self.buckets)),
+        }
+
+
+class MetricsRegistry:
+
+    def __init__(self):
+        self.enabled = False
+        self.histograms = {}
+        self._lock = allocate_lock()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self.histograms = {}
+
+    def observe(self, name, start, nbytes=0):
+        # start is the perf_counter() value taken when the call began
+        elapsed = perf_counter() - start
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.add(elapsed, nbytes)
+
+    def snapshot(self):
+        with self._lock:
+            return {name: h.to_dict() for name, h in sorted(self.histograms.items())}
+
+    def profile(self, path=None):
+        # capture a cProfile of a with-block; the profiler is returned by __enter__ so it can be
+        # fed to pstats, and written to path (for snakeviz, pstats etc.) if one is given
+        return _Profile(path)
+
+
+class _Profile:
+
+    def __init__(self, path=None):
+        import cProfile  # only paid for when someone profiles
+
+        self.path = path
+        self.profiler = cProfile.Profile()
+
+    def __enter__(self):
+        self.profiler.enable()
+        return self.profiler
+
+    def __exit__(self, *exc_info):
+        self.profiler.disable()
+        if self.path is not None:
+            self.profiler.dump_stats(self.path)
+
+
+metrics = MetricsRegistry()
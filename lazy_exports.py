@@ -0,0 +1,34 @@
+"""
+Lazy package exports.
+
+A pattern package maps each public name to the submodule that defines it:
+
+    __all__, __getattr__, __dir__ = lazy_exports(__name__, {
+        "Director": "builder",
+        "HouseWriter": "house_io",
+    })
+
+`import builder` then only runs this, and the submodule is imported the first time one of its names
+is looked up. The value is stored in the package afterwards, so later lookups skip __getattr__.
+"""
+
+import sys
+
+
+def lazy_exports(package, exports):
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name):
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        import importlib
+
+        value = getattr(importlib.import_module(f".{module}", package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(exports))
+
+    return list(exports), __getattr__, __dir__
@@ -0,0 +1,10 @@
+"""Singleton pattern: __new__ with a lock, and a metaclass. Run `python -m singleton` for the walkthrough."""
+
+from lazy_exports import lazy_exports
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    "Singleton": "singletoon",
+    "SingletonMeta": "singletoon",
+    "DatabaseConnection": "singletoon",
+    "Logger": "singletoon",
+})
@@ -0,0 +1,24 @@
+"""
+Walkthrough of the singleton examples: python -m singleton
+"""
+
+from .singletoon import DatabaseConnection, Logger, Singleton
+
+
+Singleton1 = Singleton()
+Singleton2 = Singleton()
+
+
+print(Singleton1 is Singleton2)
+
+
+db1 = DatabaseConnection()
+db2 = DatabaseConnection()
+
+print(db1 is db2)
+
+
+l1 = Logger()
+l2 = Logger()
+
+print(l1 is l2)
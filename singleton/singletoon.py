@@ -11,7 +11,6 @@ class Singleton:
         if cls._instance is None:
 
             with cls._lock:
-                print("OBJ DOES NOT EXIST CREATING THE SAME")
 
                 if not cls._instance:
 
@@ -22,12 +21,6 @@ class Singleton:
         return cls._instance
 
 
-Singleton1 = Singleton()
-Singleton2 = Singleton()
-
-
-print(Singleton1 is Singleton2)
-
 """
 
 Q. Why Use cls in __new__?
@@ -113,7 +106,6 @@ class SingletonMeta(type):
         if cls not in cls._instances:
             instance = super().__call__(*args, **kwargs)
             cls._instances[cls] = instance
-            print(cls._instances)
         return cls._instances[cls]
 
 
@@ -127,15 +119,3 @@ class Logger(metaclass=SingletonMeta):
 
     def __init__(self):
         self.log_file = "/var/log/app.log"
-
-
-db1 = DatabaseConnection()
-db2 = DatabaseConnection()
-
-print(db1 is db2)
-
-
-l1 = Logger()
-l2 = Logger()
-
-print(l1 is l2)
@@ -0,0 +1,18 @@
+import os
+import sys
+
+import pytest
+
+# the pattern packages live at the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(autouse=True)
+def plugin_registry(tmp_path, monkeypatch):
+    # the process-wide registry reads its environment variables at import time, so it is replaced
+    # instead: no test scans the installed distributions or writes the user's ~/.cache
+    from design_patterns_plugins import PluginRegistry, discovery
+
+    registry = PluginRegistry([], str(tmp_path / "plugin-cache" / "index.cache"), use_entry_points=False)
+    monkeypatch.setattr(discovery, "registry", registry)
+    return registry
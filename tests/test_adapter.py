@@ -0,0 +1,110 @@
+import json
+
+import pytest
+
+from adpater import AnalyticsAdapter, Field, RecordSchema
+
+
+class Provider:
+
+    def __init__(self, xml_data):
+        self.xml_data = xml_data
+
+    def get_xml_data(self):
+        return self.xml_data
+
+
+def record(xml_data, *fields):
+    import xml.etree.ElementTree as ET
+
+    return RecordSchema("stock", fields).compile().record(ET.fromstring(xml_data))
+
+
+def test_namespaced_paths():
+    xml_data = ('<stock xmlns:q="http://ex.com/q"><name>ABC</name>'
+                '<q:bid>2</q:bid><quote><q:ask>3</q:ask></quote></stock>')
+    assert record(xml_data,
+                  Field("name"),
+                  Field("bid", path="{http://ex.com/q}bid", convert=int),
+                  Field("ask", path="quote/{http://ex.com/q}ask", convert=int)) == {
+        "name": "ABC", "bid": 2, "ask": 3}
+
+
+@pytest.mark.parametrize("path", ["./name", "*", "name[1]", "quote//bid", "/name", "name/",
+                                  "..", "q:bid", "{http://ex.com/q", "@id"])
+def test_unsupported_paths_are_rejected(path):
+    schema = RecordSchema("stock", [Field("name", path=path)])
+    with pytest.raises(ValueError, match="Unsupported field path"):
+        schema.compile()
+
+
+def test_defaults_and_convert():
+    fields = (Field("name"), Field("price", convert=float, default=0.0), Field("volume", default=-1))
+    assert record("<stock><name>ABC</name><price>1.5</price></stock>", *fields) == {
+        "name": "ABC", "price": 1.5, "volume": -1}
+    # an empty element has no text and gets the default too
+    assert record("<stock><name/><price/></stock>", *fields) == {
+        "name": None, "price": 0.0, "volume": -1}
+
+
+def test_nested_paths():
+    xml_data = "<stock><quote><bid>1</bid><ask>2</ask></quote><name>ABC</name></stock>"
+    assert record(xml_data,
+                  Field("name"),
+                  Field("bid", path="quote/bid", convert=int),
+                  Field("ask", path="quote/ask", convert=int),
+                  Field("quote_bid_again", path="quote/bid")) == {
+        "name": "ABC", "bid": 1, "ask": 2, "quote_bid_again": "1"}
+
+
+def test_first_repeated_tag_wins_like_find():
+    import xml.etree.ElementTree as ET
+
+    xml_data = ("<stock><name>first</name><name>second</name>"
+                "<quote><bid>1</bid></quote><quote><bid>2</bid></quote></stock>")
+    element = ET.fromstring(xml_data)
+    result = record(xml_data, Field("name"), Field("bid", path="quote/bid"))
+    assert result == {"name": element.find("name").text, "bid": element.find("quote/bid").text}
+    assert result == {"name": "first", "bid": "1"}
+
+
+def test_two_fields_on_one_tag():
+    assert record("<stock><price>2</price></stock>",
+                  Field("price"), Field("price_value", path="price", convert=int)) == {
+        "price": "2", "price_value": 2}
+
+
+def test_compile_is_cached():
+    schema = RecordSchema("stock", [Field("name")])
+    assert schema.compile() is schema.compile()
+
+
+SCHEMA = RecordSchema("stock", [Field("name"), Field("price", convert=float, default=0.0),
+                                Field("bid", path="quote/bid", convert=float)])
+
+
+@pytest.mark.parametrize("xml_data", [
+    "<stocks><stock><name>ABC</name><price>100</price></stock></stocks>",
+    "<stocks><stock><name>A</name><price>1</price><quote><bid>0.5</bid></quote></stock>"
+    "<stock><name>B</name></stock><other><name>skip</name></other></stocks>",
+    # a record tag nested under a non-record element is not a record, like findall("stock")
+    "<stocks><group><stock><name>nested</name></stock></group><stock><name>top</name></stock></stocks>",
+    "<stocks></stocks>",
+    "<stocks/>",
+])
+def test_batch_streaming_and_columnar_agree(xml_data):
+    adapter = AnalyticsAdapter(Provider(xml_data), SCHEMA)
+    batch = json.loads(adapter.get_data_in_json())
+    streamed = list(adapter.iter_records())
+    columns = adapter.get_columns()
+
+    assert batch == streamed
+    assert list(columns) == ["name", "price", "bid"]
+    assert [dict(zip(columns, row)) for row in zip(*columns.values())] == streamed
+    assert "nested" not in columns["name"]
+
+
+def test_default_schema_keeps_the_old_output():
+    adapter = AnalyticsAdapter(Provider(
+        "<stocks><stock><name>ABC</name><price>100</price></stock></stocks>"))
+    assert json.loads(adapter.get_data_in_json()) == [{"name": "ABC", "price": "100"}]
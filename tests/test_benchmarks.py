@@ -0,0 +1,54 @@
+import io
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.runner import Benchmark, compare, run_benchmark
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def results(**medians):
+    return {"benchmarks": {name: {"median": median} for name, median in medians.items()}}
+
+
+OLD = results(steady=1.0, slower=1.0, quicker=1.0, removed=1.0)
+NEW = results(steady=1.05, slower=1.5, quicker=0.5, added=1.0)
+
+
+def test_compare_reports_regressions_only():
+    out = io.StringIO()
+    assert compare(OLD, NEW, threshold=0.10, out=out) == ["slower"]
+
+    lines = {line.split()[0]: line for line in out.getvalue().splitlines()}
+    assert "REGRESSION" in lines["slower"]
+    assert "faster" in lines["quicker"]
+    assert "REGRESSION" not in lines["steady"] and "faster" not in lines["steady"]
+    assert "only in old" in lines["removed"]
+    assert "only in new" in lines["added"]
+
+
+def test_compare_threshold():
+    assert compare(OLD, NEW, threshold=0.60, out=io.StringIO()) == []
+
+
+@pytest.mark.parametrize("new, status", [(NEW, 1), (OLD, 0), (results(steady=0.1), 0)])
+def test_compare_exit_code(tmp_path, new, status):
+    old_path, new_path = tmp_path / "old.json", tmp_path / "new.json"
+    old_path.write_text(json.dumps(OLD))
+    new_path.write_text(json.dumps(new))
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks", "compare", str(old_path), str(new_path)],
+        cwd=ROOT, capture_output=True, text=True)
+    assert result.returncode == status, result.stdout + result.stderr
+
+
+def test_self_timed_benchmark_uses_returned_seconds():
+    bench = Benchmark("example", lambda: lambda: 0.5, number=2, ops=10, self_timed=True)
+    result = run_benchmark(bench, warmup=0, repeat=3)
+    assert result["median"] == 0.5
+    assert result["ops_per_sec"] == 20
@@ -0,0 +1,116 @@
+import pytest
+
+from builder import Director, GlassHouseBuilder, House, HouseBuilder, WoodenHouseBuilder, compile_plan
+
+
+class SizedHouseBuilder(HouseBuilder):
+
+    def __init__(self, windows):
+        self.windows = windows
+        self.house = House()
+
+    def build_walls(self):
+        self.house.walls = "brick"
+
+    def build_windows(self):
+        self.house.windows = self.windows
+
+    def get_house(self):
+        return self.house
+
+
+def test_construct_many_gives_independent_houses():
+    houses = Director(GlassHouseBuilder()).construct_many(3)
+    houses[0].windows = 99
+    assert [h.windows for h in houses] == [99, 10, 10]
+    assert len({id(h) for h in houses}) == 3
+
+
+def test_construct_compiled_matches_construct_house():
+    for builder_class in (WoodenHouseBuilder, GlassHouseBuilder):
+        expected = Director(builder_class()).construct_house().__dict__
+        director = Director(builder_class())
+        first, second = director.construct_compiled(), director.construct_compiled()
+        assert first.__dict__ == second.__dict__ == expected
+        assert first is not second
+
+
+def test_compiled_plan_uses_the_directors_builder():
+    # a builder with constructor arguments, configured per instance
+    assert Director(SizedHouseBuilder(7)).construct_compiled().windows == 7
+    assert Director(SizedHouseBuilder(3)).construct_compiled().windows == 3
+
+
+def test_compile_plan_refuses_builder_class_needing_arguments():
+    with pytest.raises(TypeError):
+        compile_plan(SizedHouseBuilder)
+
+
+def test_patching_a_step_invalidates_the_plan():
+    class PatchedBuilder(WoodenHouseBuilder):
+        pass
+
+    director = Director(PatchedBuilder())
+    assert director.construct_compiled().doors == 1
+
+    def build_doors(self):
+        self.house.doors = 5
+
+    PatchedBuilder.build_doors = build_doors
+    assert director.construct_compiled().doors == 5
+
+
+def test_replacing_the_directors_builder_recompiles():
+    director = Director(WoodenHouseBuilder())
+    assert director.construct_compiled().walls == "wooden"
+    director.builder = GlassHouseBuilder()
+    assert director.construct_compiled().walls == "glass"
+
+
+class RoomsHouseBuilder(WoodenHouseBuilder):
+
+    def build_windows(self):
+        self.house.windows = [1, 2]  # mutable: must not be shared between houses
+
+
+def test_construct_many_deep_copies_mutable_fields():
+    houses = Director(RoomsHouseBuilder()).construct_many(2)
+    houses[0].windows.append(3)
+    assert houses[1].windows == [1, 2]
+    assert houses[0].clone().windows == [1, 2, 3]
+    assert houses[0].clone().windows is not houses[0].windows
+
+
+def test_construct_many_does_not_return_the_builders_house():
+    builder = WoodenHouseBuilder()
+    houses = Director(builder).construct_many(2)
+    assert all(house is not builder.house for house in houses)
+
+
+def test_compile_plan_leaves_the_builder_alone():
+    builder = WoodenHouseBuilder()
+    compile_plan(builder)
+    Director(builder).construct_compiled()
+    assert vars(builder.house) == vars(House())
+
+
+def test_compiled_plan_copies_mutable_fields():
+    director = Director(RoomsHouseBuilder())
+    first, second = director.construct_compiled(), director.construct_compiled()
+    first.windows.append(3)
+    assert second.windows == [1, 2]
+
+
+def test_compiled_plan_is_measured_when_metrics_are_on():
+    from instrumentation import metrics
+
+    director = Director(WoodenHouseBuilder())
+    director.construct_compiled()
+    metrics.reset()
+    metrics.enable()
+    try:
+        assert director.construct_compiled().walls == "wooden"
+        assert metrics.snapshot()["builder.Director.construct_compiled"]["count"] == 1
+    finally:
+        metrics.disable()
+        metrics.reset()
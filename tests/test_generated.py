@@ -0,0 +1,73 @@
+import pytest
+
+from adpater import AdvancedMediaPlayer, EuropeanSocket, MediaPlayer, USPlug, make_adapter
+from adpater.generated import _adapter_cache
+
+
+class QuietPlug(USPlug):
+    def plug_into_us_socket(self):
+        return "110V"
+
+
+class QuietPlayer(AdvancedMediaPlayer):
+    def play_mp4(self, file_name):
+        return f"mp4 {file_name}"
+
+
+def plug_adapter():
+    return make_adapter(EuropeanSocket, QuietPlug, {
+        "plug_into_european_socket": "plug_into_us_socket",
+    })
+
+
+def mp4_adapter(prefix=""):
+    return make_adapter(MediaPlayer, QuietPlayer, {
+        "play": lambda player, audio_type, file_name: prefix + player.play_mp4(file_name),
+    })
+
+
+def test_rename_is_bound_to_the_adaptee():
+    plug = QuietPlug()
+    adapter = plug_adapter()(plug)
+    assert isinstance(adapter, EuropeanSocket)
+    assert adapter.adaptee is plug
+    assert adapter.plug_into_european_socket == plug.plug_into_us_socket
+    assert adapter.plug_into_european_socket.__self__ is plug
+    assert adapter.plug_into_european_socket() == "110V"
+
+
+def test_translation_gets_the_adaptee_first():
+    adapter = mp4_adapter()(QuietPlayer())
+    assert isinstance(adapter, MediaPlayer)
+    assert adapter.play("mp4", "movie.mp4") == "mp4 movie.mp4"
+
+
+def test_cache_hits():
+    assert plug_adapter() is plug_adapter()
+
+    size = len(_adapter_cache)
+    # an inline lambda is a new function every time, the class is still reused
+    assert mp4_adapter("cached") is mp4_adapter("cached") is mp4_adapter("cached")
+    assert len(_adapter_cache) == size + 1
+
+
+def test_different_closures_get_different_classes():
+    loud, quiet = mp4_adapter("!"), mp4_adapter("")
+    assert loud is not quiet
+    assert loud(QuietPlayer()).play("mp4", "a.mp4") == "!mp4 a.mp4"
+
+
+def test_unknown_target_method():
+    with pytest.raises(ValueError, match="EuropeanSocket has no method 'charge'"):
+        make_adapter(EuropeanSocket, QuietPlug, {"charge": "plug_into_us_socket"})
+
+
+def test_unknown_adaptee_method():
+    with pytest.raises(ValueError, match="QuietPlug has no method 'plug_in'"):
+        make_adapter(EuropeanSocket, QuietPlug, {"plug_into_european_socket": "plug_in"})
+
+
+@pytest.mark.parametrize("spec", [42, ["plug_into_us_socket"]])
+def test_spec_must_be_a_name_or_a_callable(spec):
+    with pytest.raises(ValueError, match="must be a method name or a callable"):
+        make_adapter(EuropeanSocket, QuietPlug, {"plug_into_european_socket": spec})
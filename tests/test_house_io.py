@@ -0,0 +1,151 @@
+import io
+import struct
+
+import pytest
+
+from builder import (Director, GlassHouseBuilder, House, HouseReader, HouseWriter, WoodenHouseBuilder,
+                     dump, dumps, iter_file, loads)
+from builder.house_io import CHUNK_RECORDS, FOOTER, HEADER, RECORD
+
+
+def make_houses():
+    return [
+        Director(WoodenHouseBuilder()).construct_house(),
+        Director(GlassHouseBuilder()).construct_house(),
+        House(),  # unbuilt: every field is None
+        Director(WoodenHouseBuilder()).construct_house(),
+    ]
+
+
+def fields(houses):
+    return [vars(house) for house in houses]
+
+
+def test_dumps_loads_round_trip():
+    houses = make_houses()
+    assert fields(loads(dumps(houses))) == fields(houses)
+
+
+def test_empty_round_trip():
+    assert loads(dumps([])) == []
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_file_round_trip(tmp_path, use_mmap):
+    houses = make_houses()
+    path = tmp_path / "houses.bin"
+    with open(path, "wb") as f:
+        dump(houses, f)
+
+    with HouseReader.open(path, use_mmap=use_mmap) as reader:
+        assert len(reader) == len(houses)
+        assert fields(reader) == fields(houses)
+
+
+def test_buffer_round_trip():
+    houses = make_houses()
+    buffer = bytearray(1000)
+    writer = HouseWriter(buffer)
+    writer.write_many(houses)
+    size = writer.close()
+
+    assert size == writer.size == len(dumps(houses))
+    assert writer.close() == size
+    assert fields(HouseReader(memoryview(buffer)[:size])) == fields(houses)
+
+
+def test_buffer_too_small():
+    with pytest.raises(ValueError):
+        dump(make_houses(), bytearray(HEADER.size + 4))
+
+
+def test_random_access():
+    houses = make_houses()
+    reader = HouseReader(dumps(houses))
+    assert vars(reader[1]) == vars(houses[1])
+    assert vars(reader[-1]) == vars(houses[-1])
+    assert vars(reader[-len(houses)]) == vars(houses[0])
+    for index in (len(houses), -len(houses) - 1):
+        with pytest.raises(IndexError):
+            reader[index]
+
+
+def test_close_with_open_iterator(tmp_path):
+    path = tmp_path / "houses.bin"
+    path.write_bytes(dumps(make_houses()))
+
+    reader = HouseReader.open(path)
+    iterator = iter(reader)
+    next(iterator)
+    reader.close()
+    reader.close()
+    assert list(iterator) == []
+
+
+def test_bad_magic():
+    data = bytearray(dumps(make_houses()))
+    data[:4] = b"NOPE"
+    with pytest.raises(ValueError, match="bad magic"):
+        HouseReader(data)
+
+
+def test_bad_version():
+    data = bytearray(dumps(make_houses()))
+    struct.pack_into("<H", data, 4, 99)
+    with pytest.raises(ValueError, match="version: 99"):
+        HouseReader(data)
+
+
+def test_bad_count():
+    data = bytearray(dumps(make_houses()))
+    count, offset, magic = FOOTER.unpack_from(data, len(data) - FOOTER.size)
+    FOOTER.pack_into(data, len(data) - FOOTER.size, count + 1, offset, magic)
+    with pytest.raises(ValueError, match="record count"):
+        HouseReader(data)
+
+
+def test_too_short():
+    with pytest.raises(ValueError, match="too short"):
+        HouseReader(b"HOUS")
+
+
+def test_writer_accepts_file_objects():
+    buffer = io.BytesIO()
+    with HouseWriter(buffer) as writer:
+        writer.write(House())
+    assert fields(loads(buffer.getvalue())) == [vars(House())]
+
+
+
+def test_iter_file_reads_in_chunks(tmp_path):
+    houses = make_houses() * (CHUNK_RECORDS // 2) + [House()]
+    path = tmp_path / "houses.bin"
+    with open(path, "wb") as f:
+        dump(houses, f)
+
+    with open(path, "rb") as f:
+        assert fields(iter_file(f)) == fields(houses)
+
+
+def test_iter_file_checks_header_and_footer():
+    data = dumps(make_houses())
+    with pytest.raises(ValueError, match="bad magic"):
+        list(iter_file(io.BytesIO(data[:-1])))
+    with pytest.raises(ValueError, match="too short"):
+        list(iter_file(io.BytesIO(data[:HEADER.size])))
+
+
+def test_aborted_dump_has_no_footer():
+    buffer = io.BytesIO()
+    with pytest.raises(RuntimeError):
+        with HouseWriter(buffer) as writer:
+            writer.write_many(make_houses())
+            writer.flush()
+            raise RuntimeError("cut short")
+
+    data = buffer.getvalue()
+    assert len(data) == HEADER.size + len(make_houses()) * RECORD.size
+    with pytest.raises(ValueError):
+        HouseReader(data)
+    with pytest.raises(ValueError):
+        list(iter_file(io.BytesIO(data)))
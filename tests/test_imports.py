@@ -0,0 +1,71 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# cumulative `-X importtime` budget of `import <package>`, in microseconds.
+# The pattern packages only run lazy_exports; instrumentation and design_patterns_plugins load
+# their modules eagerly
+BUDGETS = {
+    "abstract": 3_000,
+    "adpater": 3_000,
+    "builder": 3_000,
+    "factory": 3_000,
+    "singleton": 3_000,
+    "instrumentation": 10_000,
+    "design_patterns_plugins": 10_000,
+}
+
+EAGER = {"instrumentation", "design_patterns_plugins"}
+
+
+def run(code, *options):
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True)
+
+
+def import_time(package):
+    # cumulative microseconds of the package's top-level import line
+    for line in run(f"import {package}", "-X", "importtime").stderr.splitlines():
+        _, _, rest = line.partition("import time:")
+        fields = [field.strip() for field in rest.split("|")]
+        if len(fields) == 3 and fields[2] == package:
+            return int(fields[1])
+    raise AssertionError(f"{package} missing from -X importtime output")
+
+
+@pytest.mark.parametrize("package", sorted(BUDGETS))
+def test_import_time_budget(package):
+    run(f"import {package}")  # make sure the .pyc files exist
+    best = min(import_time(package) for _ in range(3))
+    assert best <= BUDGETS[package], f"import {package} took {best}us"
+
+
+@pytest.mark.parametrize("package", sorted(set(BUDGETS) - EAGER))
+def test_import_loads_no_submodule(package):
+    code = (f"import sys, {package}; "
+            f"print(sorted(m for m in sys.modules if m.startswith('{package}.')))")
+    assert run(code).stdout.strip() == "[]"
+
+
+@pytest.mark.parametrize("package, name, submodule", [
+    ("builder", "Director", "builder.builder"),
+    ("factory", "shipping_factory", "factory.factory"),
+    ("adpater", "make_adapter", "adpater.generated"),
+])
+def test_lookup_loads_its_submodule(package, name, submodule):
+    code = (f"import sys, {package}; {package}.{name}; "
+            f"print('{submodule}' in sys.modules, '{name}' in vars({package}), '{name}' in dir({package}))")
+    assert run(code).stdout.split() == ["True", "True", "True"]
+
+
+def test_unknown_name_raises_attribute_error():
+    import builder
+
+    with pytest.raises(AttributeError, match="has no attribute 'Nope'"):
+        builder.Nope
@@ -0,0 +1,88 @@
+import pytest
+
+from abstract import CreditCardFactory, PayPalFactory
+from builder import Director, HouseBuilder
+from factory import shipping_factory
+from instrumentation import BUCKETS, Histogram, MetricsRegistry, export_text, metrics
+
+
+@pytest.fixture
+def enabled():
+    metrics.reset()
+    metrics.enable()
+    yield metrics
+    metrics.disable()
+    metrics.reset()
+
+
+def test_buckets_resolve_sub_microsecond_calls():
+    assert BUCKETS[0] <= 100e-9
+    assert list(BUCKETS) == sorted(BUCKETS)
+
+    histogram = Histogram()
+    histogram.add(300e-9)
+    assert histogram.percentile(0.5) == 300e-9  # capped at the largest value seen
+    assert histogram.buckets[BUCKETS.index(5e-7)] == 1
+
+
+def test_disabled_registry_records_nothing():
+    metrics.reset()
+    shipping_factory("express")
+    assert metrics.snapshot() == {}
+
+
+def test_calls_that_raise_are_counted(enabled):
+    shipping_factory("express")
+    with pytest.raises(ValueError):
+        shipping_factory("teleport")
+    assert enabled.snapshot()["factory.shipping_factory"]["count"] == 2
+
+
+def test_failing_builder_step_is_counted(enabled):
+    class BrokenBuilder(HouseBuilder):
+        def build_walls(self):
+            raise RuntimeError("no bricks")
+
+    with pytest.raises(RuntimeError):
+        Director(BrokenBuilder()).construct_house()
+    snapshot = enabled.snapshot()
+    assert snapshot["builder.BrokenBuilder.build_walls"]["count"] == 1
+    assert snapshot["builder.Director.construct_house"]["count"] == 1
+
+
+def test_payment_factory_names(enabled):
+    CreditCardFactory().create_payment()
+    CreditCardFactory().create_notification()
+    PayPalFactory().create_payment()
+    PayPalFactory().create_notification()
+    assert sorted(enabled.snapshot()) == [
+        "abstract.CreditCardFactory.create_notification",
+        "abstract.CreditCardFactory.create_payment",
+        "abstract.PayPalFactory.create_notification",
+        "abstract.PayPalFactory.create_payment",
+    ]
+
+
+def test_export_text():
+    registry = MetricsRegistry()
+    registry.observe("example", 0.0)
+    assert export_text(registry).splitlines()[1].startswith("example")
+
+
+def test_analytics_outputs_report_utf8_bytes(enabled):
+    from adpater import AnalyticsAdapter
+
+    class Provider:
+        def get_xml_data(self):
+            return "<stocks><stock><name>Café</name><price>1</price></stock></stocks>"
+
+    adapter = AnalyticsAdapter(Provider())
+    adapter.get_data_in_json()
+    list(adapter.iter_records())
+    adapter.get_columns()
+
+    size = len(Provider().get_xml_data().encode("utf-8"))
+    snapshot = enabled.snapshot()
+    for name in ("get_data_in_json", "iter_records", "get_columns"):
+        stats = snapshot[f"adapter.AnalyticsAdapter.{name}"]
+        assert (stats["count"], stats["bytes"]) == (1, size)
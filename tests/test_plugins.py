@@ -0,0 +1,167 @@
+import os
+import sys
+
+import pytest
+
+import design_patterns_plugins as plugins
+from design_patterns_plugins import PluginRegistry, discovery
+from factory import Shipping, shipping_factory
+
+
+OVERNIGHT = '''PRODUCTS = {"shipping": {"overnight": "OvernightShipping"}}
+
+from factory import Shipping
+
+
+class OvernightShipping(Shipping):
+    def calculate_cost(self):
+        return 30.0
+'''
+
+PIZZA = '''PRODUCTS = {"pizza": {"pepperoni": "Pepperoni"}}
+
+class Pepperoni:
+    pass
+'''
+
+
+def write(directory, name, source):
+    path = directory / name
+    path.write_text(source)
+    # make sure the directory mtime moves even on coarse-grained file systems
+    stat = os.stat(directory)
+    os.utime(directory, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    return path
+
+
+@pytest.fixture
+def plugin_dir(tmp_path):
+    directory = tmp_path / "plugins"
+    directory.mkdir()
+    write(directory, "overnight_plugin.py", OVERNIGHT)
+    yield directory
+    sys.modules.pop("design_patterns_plugin_overnight_plugin", None)
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "cache" / "plugins.cache")
+
+
+def make_registry(plugin_dir, cache_path):
+    return PluginRegistry([str(plugin_dir)], cache_path, use_entry_points=False)
+
+
+def test_discovery(plugin_dir, cache_path):
+    registry = make_registry(plugin_dir, cache_path)
+    assert registry.names("shipping") == ["overnight"]
+    assert registry.names("pizza") == []
+    assert registry.load("shipping", "teleport") is None
+
+
+def test_products_are_imported_lazily(plugin_dir, cache_path):
+    registry = make_registry(plugin_dir, cache_path)
+    registry.names("shipping")
+    assert "design_patterns_plugin_overnight_plugin" not in sys.modules
+
+    product = registry.load("shipping", "overnight")
+    assert "design_patterns_plugin_overnight_plugin" in sys.modules
+    assert issubclass(product, Shipping)
+    assert product().calculate_cost() == 30.0
+    assert registry.load("shipping", "overnight") is product
+
+
+def test_cache_is_reused(plugin_dir, cache_path, monkeypatch):
+    make_registry(plugin_dir, cache_path).index()
+    assert os.path.exists(cache_path)
+
+    def no_scan(self, fingerprint):
+        raise AssertionError("the cached index should have been used")
+
+    monkeypatch.setattr(PluginRegistry, "_scan", no_scan)
+    assert make_registry(plugin_dir, cache_path).names("shipping") == ["overnight"]
+
+
+def test_new_file_invalidates_cache(plugin_dir, cache_path):
+    make_registry(plugin_dir, cache_path).index()
+    write(plugin_dir, "pizza_plugin.py", PIZZA)
+    assert make_registry(plugin_dir, cache_path).names("pizza") == ["pepperoni"]
+
+
+def test_refresh_picks_up_edits_in_place(plugin_dir, cache_path):
+    registry = make_registry(plugin_dir, cache_path)
+    registry.index()
+    (plugin_dir / "overnight_plugin.py").write_text(OVERNIGHT.replace('"overnight"', '"nextday"'))
+    registry.refresh()
+    assert registry.names("shipping") == ["nextday"]
+
+
+@pytest.mark.parametrize("source", [
+    "PRODUCTS = {\n",
+    "PRODUCTS = ['overnight']\n",
+    "PRODUCTS = {'shipping': ['overnight']}\n",
+    "PRODUCTS = {'shipping': {'overnight': make()}}\n",
+])
+def test_bad_file_is_skipped_with_a_warning(plugin_dir, cache_path, source):
+    bad = write(plugin_dir, "bad_plugin.py", source)
+    registry = make_registry(plugin_dir, cache_path)
+    with pytest.warns(RuntimeWarning, match=str(bad)):
+        assert registry.names("shipping") == ["overnight"]
+
+
+def test_environment_variables(plugin_dir, cache_path, monkeypatch):
+    monkeypatch.setenv("DESIGN_PATTERNS_PLUGIN_PATH", str(plugin_dir))
+    monkeypatch.setenv("DESIGN_PATTERNS_PLUGIN_CACHE", cache_path)
+    registry = PluginRegistry(use_entry_points=False)
+    assert registry.directories == [str(plugin_dir)]
+    assert registry.cache_path == cache_path
+
+
+def test_factory_falls_back_to_plugins(plugin_dir, cache_path, monkeypatch):
+    monkeypatch.setattr(discovery, "registry", make_registry(plugin_dir, cache_path))
+    assert plugins.names("shipping") == ["overnight"]
+    assert shipping_factory("overnight").calculate_cost() == 30.0
+    with pytest.raises(ValueError, match="teleport"):
+        shipping_factory("teleport")
+
+
+@pytest.fixture
+def fake_sys_path(tmp_path, monkeypatch):
+    # a script directory without packages, and a site directory with one
+    script_dir = tmp_path / "script"
+    site_dir = tmp_path / "site"
+    (site_dir / "example-1.0.dist-info").mkdir(parents=True)
+    script_dir.mkdir()
+    monkeypatch.setattr(sys, "path", [str(script_dir), str(site_dir)])
+    return script_dir, site_dir
+
+
+def test_only_distribution_directories_are_fingerprinted(plugin_dir, cache_path, fake_sys_path,
+                                                        monkeypatch):
+    script_dir, site_dir = fake_sys_path
+    scans = []
+    scan = PluginRegistry._scan
+    monkeypatch.setattr(PluginRegistry, "_scan",
+                        lambda self, fingerprint: scans.append(1) or scan(self, fingerprint))
+
+    def names():
+        return PluginRegistry([str(plugin_dir)], cache_path).names("shipping")
+
+    assert names() == ["overnight"] and len(scans) == 1
+
+    # a log next to the script does not invalidate the index
+    write(script_dir, "run.log", "")
+    assert names() == ["overnight"] and len(scans) == 1
+
+    # a package installed next to the existing ones does
+    write(site_dir, "other.py", "")
+    assert names() == ["overnight"] and len(scans) == 2
+
+
+def test_default_cache_path_depends_on_the_environment(monkeypatch):
+    monkeypatch.delenv("DESIGN_PATTERNS_PLUGIN_CACHE", raising=False)
+    first = discovery._default_cache_path()
+    monkeypatch.setattr(sys, "path", sys.path + ["/elsewhere"])
+    second = discovery._default_cache_path()
+    assert first != second
+    assert os.path.dirname(first) == os.path.dirname(second)